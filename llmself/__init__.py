@@ -6,6 +6,10 @@ Core LLM capabilities for code-prompt style interactions.
 
 from typing import Any, Dict, List, Optional, Union
 from dataclasses import dataclass
+from functools import lru_cache
+from importlib import import_module
+import hashlib
+import json
 
 
 @dataclass
@@ -17,6 +21,32 @@ class ThinkingContext:
     max_tokens: int = 1000
 
 
+def _base_on_digest(base_on: Union[str, List[Dict[str, Any]], None]) -> str:
+    """Short stable digest of base_on so list contexts become hashable"""
+    if base_on is None:
+        return ""
+    if isinstance(base_on, str):
+        return base_on if len(base_on) <= 64 else hashlib.blake2b(
+            base_on.encode("utf-8"), digest_size=8).hexdigest()
+    payload = json.dumps(base_on, sort_keys=True, ensure_ascii=False, default=repr)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+
+@lru_cache(maxsize=1024)
+def _think_memoized(
+    query: str,
+    base_on_digest: str,
+    expert: Optional[str],
+    length: int,
+    max_tokens: int,
+    language: str,
+    prefix_cache_key: Optional[str]
+) -> str:
+    """Exact-match LM cache for deterministic think() calls"""
+    # This is a placeholder function for LLM thinking capability
+    return f"Thinking about: {query}"
+
+
 def think(
     query: str,
     base_on: Union[str, List[Dict[str, Any]], None] = None,
@@ -24,7 +54,8 @@ def think(
     length: int = 50,
     temperature: float = 0.7,
     max_tokens: int = 1000,
-    language: str = "auto"
+    language: str = "auto",
+    prefix_cache_key: Optional[str] = None
 ) -> str:
     """
     Perform deep thinking on a query
@@ -37,14 +68,79 @@ def think(
         temperature: Creativity level (0.0-1.0)
         max_tokens: Maximum tokens in response
         language: Language for response ("auto", "en", "zh", etc.)
+        prefix_cache_key: Key from llmself.context.cache_prefix so the
+                          backend reuses the prefilled KV of a shared prefix
 
     Returns:
         The thinking result as a string
     """
+    # Deterministic calls are deduped through an exact-match LM cache;
+    # stochastic sampling (temperature > 0) must not be memoized
+    if temperature == 0.0:
+        return _think_memoized(
+            query, _base_on_digest(base_on), expert,
+            length, max_tokens, language, prefix_cache_key
+        )
+
     # This is a placeholder function for LLM thinking capability
     return f"Thinking about: {query}"
 
 
+async def athink(
+    query: str,
+    base_on: Union[str, List[Dict[str, Any]], None] = None,
+    expert: Optional[str] = None,
+    length: int = 50,
+    temperature: float = 0.7,
+    max_tokens: int = 1000,
+    language: str = "auto",
+    prefix_cache_key: Optional[str] = None
+) -> str:
+    """
+    Asynchronous counterpart of think()
+
+    Independent calls can be awaited concurrently (e.g. via
+    asyncio.gather) so their network round-trips overlap instead of
+    running serially.
+
+    Args:
+        Same as think()
+
+    Returns:
+        The thinking result as a string
+    """
+    # This is a placeholder function for async LLM thinking capability
+    return think(
+        query,
+        base_on=base_on,
+        expert=expert,
+        length=length,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        language=language,
+        prefix_cache_key=prefix_cache_key
+    )
+
+
+def think_batch(queries: List[Dict[str, Any]]) -> List[str]:
+    """
+    Perform thinking on multiple queries in one batched call
+
+    Batching amortizes dispatch overhead and lets the backend fuse
+    prefill across sequences instead of running N sequential calls.
+
+    Args:
+        queries: List of keyword-argument dicts, each accepted by think()
+                 (e.g. {"query": ..., "base_on": ..., "expert": ...})
+
+    Returns:
+        List of thinking results, one per query, in input order
+    """
+    # This is a placeholder function for batched LLM thinking capability
+    # In actual implementation, all queries would be dispatched in one model call
+    return [think(**query) for query in queries]
+
+
 def can_infer(
     query: str,
     context: Union[str, List[Dict[str, Any]], None] = None
@@ -218,9 +314,37 @@ def analyze(
     }
 
 
+# Capability exports resolved lazily (PEP 562): the owning submodule is
+# only imported on first attribute access, keeping cold-start imports of
+# llmself itself cheap
+_LAZY_EXPORTS = {
+    "expert": "llmself.role",
+    "get_expert_profile": "llmself.role",
+    "as_tool": "llmself.tools",
+    "answer_nsfw": "llmself.unsafe",
+    "check_nsfw": "llmself.unsafe",
+    "no_moral_detection": "llmself.sandbox",
+    "unrestricted_sandbox": "llmself.sandbox",
+    "safe_sandbox": "llmself.sandbox",
+    "manage_context": "llmself.context",
+    "cache_prefix": "llmself.context",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module 'llmself' has no attribute '{name}'")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value  # cache so later lookups skip __getattr__
+    return value
+
+
 # Export main functions
 __all__ = [
     "think",
+    "athink",
+    "think_batch",
     "can_infer",
     "infer",
     "generate_text",
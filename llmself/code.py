@@ -9,8 +9,13 @@ from dataclasses import dataclass
 from enum import Enum
 
 
-class ProgrammingLanguage(Enum):
+class ProgrammingLanguage(str, Enum):
     """Supported programming languages"""
+
+    # members are plain strings: they interpolate and compare as their
+    # value, so callers never need isinstance/.value branches
+    __str__ = str.__str__
+
     PYTHON = "python"
     JAVASCRIPT = "javascript"
     TYPESCRIPT = "typescript"
@@ -33,8 +38,11 @@ class ProgrammingLanguage(Enum):
     SHELL = "shell"
 
 
-class CodeComplexity(Enum):
+class CodeComplexity(str, Enum):
     """Code complexity levels"""
+
+    __str__ = str.__str__
+
     SIMPLE = "simple"
     INTERMEDIATE = "intermediate"
     ADVANCED = "advanced"
@@ -91,14 +99,12 @@ def generate_code(
     Returns:
         Generated code as string
     """
-    lang = language.value if isinstance(language, ProgrammingLanguage) else language
-    comp = complexity.value if isinstance(complexity, CodeComplexity) else complexity
-
+    # str-based enum members interpolate as their value directly
     # This is a placeholder function for code generation
     code_template = f"""
-# Generated {lang} code
+# Generated {language} code
 # Description: {description}
-# Complexity: {comp}
+# Complexity: {complexity}
 # Style: {style}
 
 def generated_function():
@@ -4,9 +4,48 @@ Context management for llmself
 Provides context tracking and management for conversations and tasks.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Mapping, Optional, Union
 from dataclasses import dataclass, field
 from datetime import datetime
+from types import MappingProxyType
+from collections import deque
+from contextvars import ContextVar
+import hashlib
+import heapq
+import json
+import time
+
+
+# Entry types interned to small int codes so filters compare ints,
+# not strings
+_TYPE_CODES: Dict[str, int] = {"message": 0, "thought": 1, "action": 2, "result": 3}
+
+# Interned settings/metadata mappings, keyed by their canonical items
+# tuple so the dict's own hash-plus-equality probe rules out collisions
+_SETTINGS_INTERN: Dict[tuple, Mapping] = {}
+
+
+def freeze(d: Mapping) -> Mapping:
+    """
+    Intern a settings/metadata dict as a shared read-only mapping
+
+    Identical configs resolve to the same object, so repeated entries
+    share one allocation and equality checks reduce to an id compare.
+
+    Args:
+        d: Mapping to intern
+
+    Returns:
+        Read-only MappingProxyType shared across identical inputs
+    """
+    # the canonical tuple is hashable and serves as the key directly;
+    # collapsing it to a bare hash() would let colliding configs alias
+    key = tuple((k, repr(v)) for k, v in sorted(d.items()))
+    cached = _SETTINGS_INTERN.get(key)
+    if cached is None:
+        cached = MappingProxyType(dict(d))
+        _SETTINGS_INTERN[key] = cached
+    return cached
 
 
 @dataclass
@@ -14,25 +53,173 @@ class ContextEntry:
     """Single context entry"""
     content: str
     entry_type: str = "message"  # "message", "thought", "action", "result"
-    timestamp: datetime = field(default_factory=datetime.now)
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    # epoch-nanosecond int clock: no datetime allocation per entry and
+    # ordering compares plain ints, while staying real wall-clock time
+    # so the datetime view below is meaningful
+    timestamp_ns: int = field(default_factory=time.time_ns)
+    metadata: Mapping[str, Any] = field(default_factory=dict)
     importance: float = 1.0  # 0.0-1.0, higher means more important
 
+    def __post_init__(self):
+        # intern metadata so identical dicts share one read-only mapping
+        if not isinstance(self.metadata, MappingProxyType):
+            self.metadata = freeze(self.metadata)
+        # known entry types collapse to an int code for cheap filtering
+        self.type_code = _TYPE_CODES.get(self.entry_type, -1)
+
+    @property
+    def timestamp(self) -> datetime:
+        """datetime view of timestamp_ns, materialized lazily for compatibility"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9)
+
 
 @dataclass
 class ConversationContext:
-    """Context for a conversation or task"""
-    entries: List[ContextEntry] = field(default_factory=list)
+    """Context for a conversation or task
+
+    Entries are stored in a bounded min-heap keyed on
+    (importance, timestamp, insertion counter) so each insert/evict is
+    O(log K) instead of periodically re-sorting the whole list.
+
+    With time_ordered=True the heap is replaced by a ring buffer
+    pre-allocated at max_entries: appends are O(1) and the oldest entry
+    is evicted automatically, with no trim path at all.
+    """
     max_entries: int = 100
     auto_summarize: bool = True
     summary_threshold: int = 50
     current_summary: str = ""
+    time_ordered: bool = False
     metadata: Dict[str, Any] = field(default_factory=dict)
+    _heap: List[tuple] = field(default_factory=list, repr=False)
+    _counter: int = field(default=0, repr=False)
+    _pending_summary: List[str] = field(default_factory=list, repr=False)
+
+    def __post_init__(self):
+        self._ring = deque(maxlen=self.max_entries) if self.time_ordered else None
+        self._t0 = None  # epoch for integer timestamp offsets in heap keys
+
+    @property
+    def entries(self) -> List[ContextEntry]:
+        """Entries in insertion order, materialized lazily from storage"""
+        if self._ring is not None:
+            return list(self._ring)
+        return [item[3] for item in sorted(self._heap, key=lambda item: item[2])]
+
+    def __len__(self) -> int:
+        if self._ring is not None:
+            return len(self._ring)
+        return len(self._heap)
+
+    def __bool__(self) -> bool:
+        # defining __len__ would otherwise make an empty context falsy,
+        # breaking "if not context" checks that mean "context missing"
+        return True
+
+    def push_entry(self, entry: ContextEntry):
+        """Add an entry (O(1) ring append or O(log K) heap push)"""
+        if self._ring is not None:
+            self._ring.append(entry)  # oldest entry evicted automatically
+            return
+        if self._t0 is None:
+            self._t0 = entry.timestamp_ns
+        # quantize the hot sort keys: importance 0.0-1.0 becomes a 0..255
+        # int and the timestamp an int nanosecond offset from the first
+        # entry, so heap compares are plain int compares instead of
+        # float and datetime rich comparisons (entries keep full precision)
+        importance_q = int(entry.importance * 255.0 + 0.5)
+        ts_offset_ns = entry.timestamp_ns - self._t0
+        heapq.heappush(
+            self._heap, (importance_q, ts_offset_ns, self._counter, entry)
+        )
+        self._counter += 1
+
+    def pop_least_important(self) -> ContextEntry:
+        """Remove and return the least important (then oldest) entry"""
+        if self._ring is not None:
+            return self._ring.popleft()
+        return heapq.heappop(self._heap)[3]
+
+    def clear_entries(self):
+        """Remove all entries"""
+        if self._ring is not None:
+            self._ring.clear()
+        self._heap.clear()
+        self._pending_summary.clear()
+
+
+class PrefixCache:
+    """Cache for prefilled prompt prefixes
+
+    Maps a stable key derived from a constant prefix (e.g. a chain's
+    shared ``setting`` dict) to an opaque KV handle, so the prefix is
+    encoded once and later calls only prefill their delta.
+    """
+
+    __slots__ = ("_handles",)
+
+    def __init__(self):
+        self._handles: Dict[str, Any] = {}
+
+    def make_key(self, prefix: Union[str, Mapping[str, Any]]) -> str:
+        """Compute a stable cache key for a prefix
+
+        A content digest (same scheme as _base_on_digest in __init__),
+        not hash(): a raw hash would let colliding prefixes alias to one
+        KV handle, and str hashes change per process under
+        PYTHONHASHSEED anyway.
+        """
+        if isinstance(prefix, Mapping):
+            payload = json.dumps(dict(prefix), sort_keys=True,
+                                 ensure_ascii=False, default=repr)
+        else:
+            payload = prefix
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+    def get_or_create(self, key: str, prefix: Union[str, Dict[str, Any]]) -> Any:
+        """Get the KV handle for a key, encoding the prefix on first use"""
+        handle = self._handles.get(key)
+        if handle is None:
+            # This is a placeholder for backend prefix prefill
+            # In actual implementation, this would encode the prefix once
+            # and return an opaque handle to the resulting KV state
+            handle = f"kv_handle:{key}"
+            self._handles[key] = handle
+        return handle
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get the KV handle for a key, or None if not cached"""
+        return self._handles.get(key)
+
+    def clear(self):
+        """Drop all cached prefix handles"""
+        self._handles.clear()
+
+
+# Global prefix cache
+_prefix_cache = PrefixCache()
+
+
+def cache_prefix(prefix: Union[str, Dict[str, Any]]) -> str:
+    """
+    Cache a constant prompt prefix and return its cache key
+
+    Args:
+        prefix: Stable prefix content (text or a setting dict)
+
+    Returns:
+        Cache key to pass as prefix_cache_key to think() and friends
+    """
+    key = _prefix_cache.make_key(prefix)
+    _prefix_cache.get_or_create(key, prefix)
+    return key
 
 
 class ContextManager:
     """Manager for conversation contexts"""
 
+    __slots__ = ("_contexts", "_current_context_id")
+
     def __init__(self):
         self._contexts: Dict[str, ConversationContext] = {}
         self._current_context_id: Optional[str] = None
@@ -41,12 +228,14 @@ class ContextManager:
         self,
         context_id: str,
         max_entries: int = 100,
-        auto_summarize: bool = True
+        auto_summarize: bool = True,
+        time_ordered: bool = False
     ) -> ConversationContext:
         """Create a new context"""
         context = ConversationContext(
             max_entries=max_entries,
-            auto_summarize=auto_summarize
+            auto_summarize=auto_summarize,
+            time_ordered=time_ordered
         )
         self._contexts[context_id] = context
         return context
@@ -92,37 +281,84 @@ class ContextManager:
             metadata=metadata or {}
         )
 
-        context.entries.append(entry)
+        context.push_entry(entry)
+
+        # Fold new content into the rolling summary once per threshold
+        # batch instead of re-summarizing the tail on every trim
+        if context.auto_summarize:
+            context._pending_summary.append(content)
+            if len(context._pending_summary) >= context.summary_threshold:
+                self._fold_summary(context)
 
         # Auto-trim if needed
-        if len(context.entries) > context.max_entries:
+        if len(context) > context.max_entries:
             self._trim_context(context)
 
         return True
 
     def _trim_context(self, context: ConversationContext):
         """Trim context entries when limit is reached"""
-        # Remove least important entries first
-        context.entries.sort(key=lambda x: (x.importance, x.timestamp))
+        # Evict the least important (then oldest) entries one heap pop at a
+        # time, keeping memory bounded at exactly max_entries without the
+        # periodic O(N log N) sort+slice cliff
+        while len(context) > context.max_entries:
+            context.pop_least_important()
+
+    def _fold_summary(self, context: ConversationContext):
+        """Fold pending entries into the rolling summary"""
+        # This is a placeholder for incremental summarization logic
+        # In actual implementation, one streaming LLM call would merge the
+        # previous summary with the pending contents
+        context.current_summary = (
+            f"Summary of {len(context._pending_summary)} new entries "
+            f"folded into: {context.current_summary or '(empty)'}"
+        )
+        context._pending_summary.clear()
 
-        # Keep the most recent and important entries
-        keep_count = context.max_entries // 2
-        context.entries = context.entries[-keep_count:]
 
-        # Update summary if auto-summarize is enabled
-        if context.auto_summarize:
-            self._update_summary(context)
+# Global context manager
+# Per-task context manager: a ContextVar gives each asyncio task or
+# thread-copied context its own manager without lock contention
+_context_manager_var: ContextVar[ContextManager] = ContextVar(
+    "llmself_context_manager", default=ContextManager()
+)
 
-    def _update_summary(self, context: ConversationContext):
-        """Update context summary"""
-        # This is a placeholder for summarization logic
-        recent_entries = context.entries[-10:]  # Last 10 entries
-        content_parts = [entry.content for entry in recent_entries]
-        context.current_summary = f"Summary of {len(context.entries)} entries"
 
+def _get_manager() -> ContextManager:
+    """Get the context manager for the current task"""
+    return _context_manager_var.get()
 
-# Global context manager
-_context_manager = ContextManager()
+
+def use_context_manager(manager: ContextManager) -> None:
+    """
+    Install a dedicated ContextManager for the current task
+
+    Args:
+        manager: Manager instance to use from here on in this task
+    """
+    _context_manager_var.set(manager)
+
+
+def _action_add(mgr, context_id, content=None, entry_type="message",
+                importance=1.0, metadata=None):
+    if not content:
+        return None
+    return mgr.add_to_context(
+        content=content,
+        entry_type=entry_type,
+        context_id=context_id,
+        importance=importance,
+        metadata=metadata
+    )
+
+
+# O(1) action dispatch table instead of a sequential elif chain
+_ACTIONS = {
+    "create": lambda mgr, context_id, **kwargs: mgr.create_context(context_id),
+    "get": lambda mgr, context_id, **kwargs: mgr.get_context(context_id),
+    "add": _action_add,
+    "set_current": lambda mgr, context_id, **kwargs: mgr.set_current_context(context_id),
+}
 
 
 def manage_context(
@@ -147,25 +383,14 @@ def manage_context(
     Returns:
         Context object, success boolean, or None depending on action
     """
-    if action == "create":
-        return _context_manager.create_context(context_id)
-
-    elif action == "get":
-        return _context_manager.get_context(context_id)
-
-    elif action == "add" and content:
-        return _context_manager.add_to_context(
-            content=content,
-            entry_type=entry_type,
-            context_id=context_id,
-            importance=importance,
-            metadata=metadata
-        )
-
-    elif action == "set_current":
-        return _context_manager.set_current_context(context_id)
-
-    return None
+    handler = _ACTIONS.get(action)
+    if handler is None:
+        return None
+    return handler(
+        _get_manager(), context_id,
+        content=content, entry_type=entry_type,
+        importance=importance, metadata=metadata
+    )
 
 
 def get_context_summary(
@@ -183,9 +408,9 @@ def get_context_summary(
         Context summary
     """
     if context_id:
-        context = _context_manager.get_context(context_id)
+        context = _get_manager().get_context(context_id)
     else:
-        context = _context_manager.get_current_context()
+        context = _get_manager().get_current_context()
 
     if not context:
         return "No context available"
@@ -214,12 +439,12 @@ def clear_context(context_id: Optional[str] = None) -> bool:
         True if successful, False otherwise
     """
     if context_id:
-        context = _context_manager.get_context(context_id)
+        context = _get_manager().get_context(context_id)
     else:
-        context = _context_manager.get_current_context()
+        context = _get_manager().get_current_context()
 
     if context:
-        context.entries.clear()
+        context.clear_entries()
         context.current_summary = ""
         return True
 
@@ -243,9 +468,9 @@ def get_context_history(
         List of context entries
     """
     if context_id:
-        context = _context_manager.get_context(context_id)
+        context = _get_manager().get_context(context_id)
     else:
-        context = _context_manager.get_current_context()
+        context = _get_manager().get_current_context()
 
     if not context:
         return []
@@ -253,7 +478,12 @@ def get_context_history(
     entries = context.entries
 
     if entry_type:
-        entries = [entry for entry in entries if entry.entry_type == entry_type]
+        code = _TYPE_CODES.get(entry_type)
+        if code is not None:
+            # int-code compare instead of per-entry string compare
+            entries = [entry for entry in entries if entry.type_code == code]
+        else:
+            entries = [entry for entry in entries if entry.entry_type == entry_type]
 
     if limit:
         entries = entries[-limit:]
@@ -266,6 +496,10 @@ __all__ = [
     "ContextEntry",
     "ConversationContext",
     "ContextManager",
+    "PrefixCache",
+    "cache_prefix",
+    "freeze",
+    "use_context_manager",
     "manage_context",
     "get_context_summary",
     "clear_context",
@@ -4,9 +4,182 @@ Creative content generation for llmself
 Provides functions for generating creative content like stories, poems, and other artistic works.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from enum import Enum
+from collections import OrderedDict
+from functools import singledispatch, wraps
+import asyncio
+import json
+import sys
+import time
+
+
+class SemanticCache:
+    """Two-tier response cache for creative generators
+
+    Tier one is an exact-match dict keyed on a canonical JSON signature
+    of the call. Tier two is an approximate match: calls whose
+    non-theme arguments are identical and whose theme text is similar
+    enough reuse the cached response without re-invoking the model.
+    Entries are evicted LRU-style and expire after a TTL.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: float = 3600.0,
+        similarity_threshold: float = 0.92
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self._exact: "OrderedDict[str, tuple]" = OrderedDict()
+        self._fuzzy: List[tuple] = []  # (rest_signature, theme_tokens, response, ts)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _theme_tokens(theme: str) -> frozenset:
+        return frozenset(theme.lower().split())
+
+    @staticmethod
+    def _similarity(a: frozenset, b: frozenset) -> float:
+        # token-overlap stand-in for embedding cosine similarity; a real
+        # backend would score sentence embeddings here
+        if not a or not b:
+            return 1.0 if a == b else 0.0
+        return len(a & b) / len(a | b)
+
+    def get(self, key: str, rest_signature: str, theme: str) -> Optional[str]:
+        """Look up a response, exact first, then approximate"""
+        now = time.monotonic()
+
+        cached = self._exact.get(key)
+        if cached is not None:
+            response, ts = cached
+            if now - ts <= self.ttl:
+                self._exact.move_to_end(key)
+                self.hits += 1
+                return response
+            del self._exact[key]
+
+        tokens = self._theme_tokens(theme)
+        for rest, cached_tokens, response, ts in self._fuzzy:
+            if (rest == rest_signature and
+                    now - ts <= self.ttl and
+                    self._similarity(tokens, cached_tokens) >= self.similarity_threshold):
+                self.hits += 1
+                return response
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, rest_signature: str, theme: str, response: str):
+        """Store a freshly generated response"""
+        ts = time.monotonic()
+        self._exact[key] = (response, ts)
+        while len(self._exact) > self.maxsize:
+            self._exact.popitem(last=False)
+        self._fuzzy.append((rest_signature, self._theme_tokens(theme), response, ts))
+        if len(self._fuzzy) > self.maxsize:
+            del self._fuzzy[0]
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache hit/miss counters and sizes"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "exact_entries": len(self._exact),
+            "fuzzy_entries": len(self._fuzzy),
+        }
+
+    def clear(self):
+        """Drop all cached responses"""
+        self._exact.clear()
+        self._fuzzy.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+# Shared cache for all creative generators
+_semantic_cache = SemanticCache()
+
+# Generation template precompiled at import so the format spec is
+# parsed once, not per call
+_GEN_TMPL = "Generated {genre_name} in {style_name} style about '{theme}' ({length} length)"
+
+# Static system scaffolding shared by every generation prompt
+_SYS_PROMPT = "You are a creative writer. Follow the rubric below.\n"
+
+
+def build_generation_prompt(
+    genre_name: str,
+    style_name: str,
+    length: str,
+    theme: str
+) -> str:
+    """
+    Assemble a generation prompt with static scaffolding first
+
+    The fixed system/genre/style/length rubric leads and the variable
+    theme comes last, so prefix caching on the serving side covers all
+    but the theme tail.
+
+    Args:
+        genre_name: Content genre
+        style_name: Writing style
+        length: Content length
+        theme: Variable theme text
+
+    Returns:
+        Full prompt string
+    """
+    return (
+        _SYS_PROMPT
+        + f"Genre: {genre_name}\n"
+        + f"Style: {style_name}\n"
+        + f"Length: {length}\n"
+        + f"Theme: {theme}"
+    )
+
+
+def semantic_cache(func):
+    """Decorator that routes a generator through the semantic cache
+
+    The first positional argument (theme, prompt, concept, ...) drives
+    the approximate match; the remaining arguments must match exactly.
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        theme = args[0] if args else ""
+        if isinstance(theme, CreativePrompt):
+            theme = theme.theme
+        theme = str(theme)
+        key = json.dumps(
+            [func.__name__, args, kwargs], sort_keys=True, default=repr
+        )
+        rest_signature = json.dumps(
+            [func.__name__, args[1:], kwargs], sort_keys=True, default=repr
+        )
+        cached = _semantic_cache.get(key, rest_signature, theme)
+        if cached is not None:
+            return cached
+        response = func(*args, **kwargs)
+        _semantic_cache.put(key, rest_signature, theme, response)
+        return response
+
+    return wrapper
+
+
+def cache_stats() -> Dict[str, Any]:
+    """Get hit/miss statistics for the creative semantic cache"""
+    return _semantic_cache.stats()
+
+
+def clear_cache():
+    """Clear the creative semantic cache"""
+    _semantic_cache.clear()
 
 
 class CreativeGenre(Enum):
@@ -42,6 +215,13 @@ class CreativeStyle(Enum):
     EXPERIMENTAL = "experimental"
 
 
+# Member-to-value maps built once at import: a dict hit replaces the
+# Enum .value descriptor lookup on hot generation paths, and sys.intern
+# lets downstream dict keys compare by pointer
+_GENRE_NAMES = {g: sys.intern(g.value) for g in CreativeGenre}
+_STYLE_NAMES = {s: sys.intern(s.value) for s in CreativeStyle}
+
+
 @dataclass
 class CreativePrompt:
     """Prompt for creative content generation"""
@@ -58,6 +238,31 @@ class CreativePrompt:
             self.specific_requirements = []
 
 
+@singledispatch
+def _normalize_prompt(prompt, genre, style):
+    """Resolve (theme, genre_name, style_name) for one prompt
+
+    singledispatch replaces the isinstance/else chain with one cached
+    type lookup per call.
+    """
+    raise TypeError(f"unsupported prompt type: {type(prompt).__name__}")
+
+
+@_normalize_prompt.register(str)
+def _(prompt, genre, style):
+    return (
+        prompt,
+        _GENRE_NAMES[genre] if genre else "story",
+        _STYLE_NAMES[style] if style else "narrative",
+    )
+
+
+@_normalize_prompt.register(CreativePrompt)
+def _(prompt, genre, style):
+    return (prompt.theme, _GENRE_NAMES[prompt.genre], _STYLE_NAMES[prompt.style])
+
+
+@semantic_cache
 def generate_content(
     prompt: Union[str, CreativePrompt],
     genre: Optional[CreativeGenre] = None,
@@ -80,19 +285,18 @@ def generate_content(
     Returns:
         Generated creative content
     """
-    if isinstance(prompt, str):
-        theme = prompt
-        genre_name = genre.value if genre else "story"
-        style_name = style.value if style else "narrative"
-    else:
-        theme = prompt.theme
-        genre_name = prompt.genre.value
-        style_name = prompt.style.value
+    theme, genre_name, style_name = _normalize_prompt(prompt, genre, style)
 
     # This is a placeholder function for creative content generation
-    return f"Generated {genre_name} in {style_name} style about '{theme}' ({length} length)"
+    return _GEN_TMPL.format_map({
+        "genre_name": genre_name,
+        "style_name": style_name,
+        "theme": theme,
+        "length": length,
+    })
 
 
+@semantic_cache
 def write_story(
     theme: str,
     genre: str = "general",
@@ -129,6 +333,7 @@ def write_story(
     return f"Story ({length}):\n" + "\n".join(story_elements)
 
 
+@semantic_cache
 def write_poem(
     theme: str,
     style: str = "free_verse",
@@ -155,6 +360,76 @@ def write_poem(
     return f"Poem about '{theme}' in {style} style with {stanzas} stanzas ({mood} mood)"
 
 
+class _CreativeBatcher:
+    """Coalesces concurrent async generation calls into batches
+
+    Calls arriving within a short collection window are grouped (up to
+    max_batch) and dispatched together, then results fan back to each
+    caller through its own Future. A real backend would issue one
+    multi-prompt request per batch so the serving side can exploit
+    continuous batching; the placeholder evaluates the grouped calls
+    locally.
+    """
+
+    def __init__(self, window: float = 0.005, max_batch: int = 32):
+        self.window = window
+        self.max_batch = max_batch
+        self._loop = None
+        self._queue: Optional["asyncio.Queue"] = None
+
+    async def submit(self, func, args, kwargs):
+        """Enqueue one call and wait for its batched result"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # first call on this event loop: start a fresh collector
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            loop.create_task(self._collect(self._queue))
+        future = loop.create_future()
+        await self._queue.put((func, args, kwargs, future))
+        return await future
+
+    async def _collect(self, queue: "asyncio.Queue"):
+        while True:
+            batch = [await queue.get()]
+            # drain peers arriving within the batching window
+            while len(batch) < self.max_batch:
+                try:
+                    batch.append(
+                        await asyncio.wait_for(queue.get(), timeout=self.window)
+                    )
+                except asyncio.TimeoutError:
+                    break
+            # one batched request would go out here; fan results back
+            for func, args, kwargs, future in batch:
+                if future.cancelled():
+                    continue
+                try:
+                    future.set_result(func(*args, **kwargs))
+                except Exception as exc:
+                    future.set_exception(exc)
+
+
+# Shared batcher for all async creative generators
+_batcher = _CreativeBatcher()
+
+
+async def agenerate_content(*args, **kwargs) -> str:
+    """Async generate_content; concurrent calls are batched together"""
+    return await _batcher.submit(generate_content, args, kwargs)
+
+
+async def awrite_story(*args, **kwargs) -> str:
+    """Async write_story; concurrent calls are batched together"""
+    return await _batcher.submit(write_story, args, kwargs)
+
+
+async def awrite_poem(*args, **kwargs) -> str:
+    """Async write_poem; concurrent calls are batched together"""
+    return await _batcher.submit(write_poem, args, kwargs)
+
+
+@semantic_cache
 def create_dialogue(
     characters: List[str],
     context: str,
@@ -180,13 +455,40 @@ def create_dialogue(
     return f"{dialogue_info} ({tone} tone, {conflict_level} conflict, {length} length)"
 
 
+@dataclass
+class Character:
+    """Generated character profile"""
+    # no defaulted fields, so manual __slots__ is safe on Python 3.9;
+    # dropping the per-instance __dict__ roughly halves the footprint
+    __slots__ = ("name", "archetype", "background", "personality_traits",
+                 "goals", "description")
+
+    name: str
+    archetype: str
+    background: str
+    personality_traits: Tuple[str, ...]
+    goals: Tuple[str, ...]
+    description: str
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Dict view for callers that expect the old mapping shape"""
+        return {
+            "name": self.name,
+            "archetype": self.archetype,
+            "background": self.background,
+            "personality_traits": list(self.personality_traits),
+            "goals": list(self.goals),
+            "description": self.description,
+        }
+
+
 def generate_character(
     name: Optional[str] = None,
     archetype: Optional[str] = None,
     background: Optional[str] = None,
     personality_traits: Optional[List[str]] = None,
     goals: Optional[List[str]] = None
-) -> Dict[str, Any]:
+) -> Character:
     """
     Generate a character profile
 
@@ -198,19 +500,19 @@ def generate_character(
         goals: Character goals and motivations
 
     Returns:
-        Character profile dictionary
+        Character profile (use .as_dict() for a plain mapping)
     """
     # This is a placeholder function for character generation
-    character = {
-        "name": name or "Generated Character",
-        "archetype": archetype or "general",
-        "background": background or "Unknown background",
-        "personality_traits": personality_traits or ["trait1", "trait2"],
-        "goals": goals or ["goal1", "goal2"],
-        "description": f"Character profile for {name or 'Generated Character'}"
-    }
-
-    return character
+    resolved_name = name or "Generated Character"
+    return Character(
+        name=resolved_name,
+        archetype=archetype or "general",
+        background=background or "Unknown background",
+        personality_traits=tuple(personality_traits) if personality_traits
+        else ("trait1", "trait2"),
+        goals=tuple(goals) if goals else ("goal1", "goal2"),
+        description=f"Character profile for {resolved_name}"
+    )
 
 
 def brainstorm_ideas(
@@ -231,14 +533,36 @@ def brainstorm_ideas(
     Returns:
         List of creative ideas
     """
-    # This is a placeholder function for idea brainstorming
-    ideas = []
-    for i in range(quantity):
-        ideas.append(f"Creative idea #{i+1} about {topic} ({creativity_type})")
+    # One batched prompt asking for all ideas at once: a single prefill
+    # plus N decodes instead of N sequential model calls
+    batch_prompt = (
+        f"Generate {quantity} {creativity_type} ideas about {topic}, "
+        f"as a numbered list"
+    )
+    return _parse_idea_list(batch_prompt, topic, creativity_type, quantity)
 
+
+def _parse_idea_list(
+    batch_prompt: str,
+    topic: str,
+    creativity_type: str,
+    quantity: int
+) -> List[str]:
+    """Parse the numbered list returned by one batched ideas call"""
+    # This is a placeholder for dispatching batch_prompt and splitting
+    # the model's numbered-list response
+    # constant halves hoisted out of the loop; each slot is then one
+    # three-way concat into a preallocated list (no f-string parse or
+    # amortized append growth per idea)
+    prefix = "Creative idea #"
+    suffix = f" about {topic} ({creativity_type})"
+    ideas: List[str] = [""] * quantity
+    for i in range(quantity):
+        ideas[i] = prefix + str(i + 1) + suffix
     return ideas
 
 
+@semantic_cache
 def create_metaphor(
     concept: str,
     context: Optional[str] = None,
@@ -259,6 +583,7 @@ def create_metaphor(
     return f"Metaphor for '{concept}' in {style} style: [Generated metaphor]"
 
 
+@semantic_cache
 def write_scene(
     setting: str,
     characters: List[str],
@@ -295,12 +620,21 @@ def write_scene(
 
 # Export functions and classes
 __all__ = [
+    "SemanticCache",
+    "semantic_cache",
+    "cache_stats",
+    "clear_cache",
+    "build_generation_prompt",
     "CreativeGenre",
     "CreativeStyle",
     "CreativePrompt",
+    "Character",
     "generate_content",
+    "agenerate_content",
     "write_story",
+    "awrite_story",
     "write_poem",
+    "awrite_poem",
     "create_dialogue",
     "generate_character",
     "brainstorm_ideas",
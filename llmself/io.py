@@ -4,8 +4,23 @@ Input/Output operations for llmself
 Provides basic input and output functionality for code-prompt interactions.
 """
 
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
 import json
+import sys
+
+try:
+    # C-accelerated JSON (~3-6x stdlib); optional, stdlib fallback below
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: Any, pretty: bool = True) -> str:
+        option = orjson.OPT_INDENT_2 if pretty else 0
+        return orjson.dumps(obj, option=option).decode("utf-8")
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any, pretty: bool = True) -> str:
+        return json.dumps(obj, indent=2 if pretty else None, ensure_ascii=False)
 
 
 def input(
@@ -41,6 +56,10 @@ def output(
     """
     Output content to user or environment
 
+    Iterator inputs and JSON payloads are streamed chunk by chunk, so
+    the first bytes reach the user before the whole payload exists in
+    memory.
+
     Args:
         content: Content to output
         format_type: Output format ("text", "json", "markdown", "html")
@@ -48,13 +67,87 @@ def output(
         env: Environment context (for sandbox operations)
     """
     # This is a placeholder function for output capability
+    if isinstance(content, Iterator):
+        # already chunked: stream straight through
+        output_stream(content, format_type=format_type, env=env)
+        return
+
     if format_type == "json" and isinstance(content, (dict, list)):
-        formatted_content = json.dumps(content, indent=2, ensure_ascii=False)
-    else:
-        formatted_content = str(content)
+        # stream encoder fragments instead of materializing the payload
+        output_stream(
+            iter_format_output(content, format_type="json"),
+            format_type=format_type,
+            env=env
+        )
+        return
 
     # In actual implementation, this would handle the output
-    print(f"Output ({format_type}): {formatted_content}")
+    print(f"Output ({format_type}): {content}")
+
+
+def output_stream(
+    content_iter: Iterable[Any],
+    format_type: str = "text",
+    env: Optional[Any] = None
+) -> None:
+    """
+    Stream output chunks as they become available
+
+    Memory stays O(chunk) and perceived latency drops to the time of
+    the first chunk instead of the whole payload.
+
+    Args:
+        content_iter: Iterable of output chunks
+        format_type: Output format label
+        env: Environment context (for sandbox operations)
+    """
+    sys.stdout.write(f"Output ({format_type}): ")
+    for chunk in content_iter:
+        sys.stdout.write(str(chunk))
+        sys.stdout.flush()
+    sys.stdout.write("\n")
+
+
+def iter_format_output(
+    content: Any,
+    format_type: str = "text",
+    pretty: bool = True
+) -> Iterator[str]:
+    """
+    Yield formatted output chunk by chunk
+
+    JSON uses JSONEncoder.iterencode so no intermediate string is built;
+    markdown streams section by section.
+
+    Args:
+        content: Content to format
+        format_type: Target format ("text", "json", "markdown", "xml")
+        pretty: Whether to use pretty formatting
+
+    Yields:
+        Formatted output chunks
+    """
+    if format_type == "json":
+        if isinstance(content, (dict, list)):
+            encoder = json.JSONEncoder(
+                indent=2 if pretty else None, ensure_ascii=False
+            )
+        else:
+            content = {"content": content}
+            encoder = json.JSONEncoder(
+                indent=2 if pretty else None, ensure_ascii=False
+            )
+        for chunk in encoder.iterencode(content):
+            yield chunk
+    elif format_type == "markdown" and isinstance(content, dict):
+        first = True
+        for key, value in content.items():
+            if not first:
+                yield "\n"
+            yield f"## {key}\n{value}\n"
+            first = False
+    else:
+        yield str(content)
 
 
 def format_output(
@@ -76,21 +169,11 @@ def format_output(
         Formatted content as string
     """
     if format_type == "json":
+        # whole-string result, so the C serializer applies directly
         if isinstance(content, (dict, list)):
-            return json.dumps(content, indent=2 if pretty else None, ensure_ascii=False)
-        else:
-            return json.dumps({"content": content}, indent=2 if pretty else None)
-
-    elif format_type == "markdown":
-        if isinstance(content, dict):
-            lines = []
-            for key, value in content.items():
-                lines.append(f"## {key}")
-                lines.append(str(value))
-                lines.append("")
-            return "\n".join(lines)
-
-    return str(content)
+            return _json_dumps(content, pretty)
+        return _json_dumps({"content": content}, pretty)
+    return "".join(iter_format_output(content, format_type=format_type, pretty=pretty))
 
 
 def parse_input(
@@ -111,13 +194,17 @@ def parse_input(
     """
     if expected_type == "json":
         try:
-            return json.loads(raw_input)
-        except json.JSONDecodeError:
+            return _json_loads(raw_input)
+        except ValueError:  # covers json and orjson decode errors
             if strict:
                 raise
             return raw_input
 
     elif expected_type == "int":
+        # fast path: plain digit strings skip exception-driven parsing
+        stripped = raw_input.strip()
+        if stripped.isdigit() or (stripped[1:].isdigit() and stripped[:1] in "+-"):
+            return int(stripped)
         try:
             return int(raw_input)
         except ValueError:
@@ -140,6 +227,8 @@ def parse_input(
 __all__ = [
     "input",
     "output",
+    "output_stream",
     "format_output",
+    "iter_format_output",
     "parse_input"
 ]
\ No newline at end of file
@@ -5,8 +5,10 @@ Provides knowledge base querying and information retrieval capabilities.
 """
 
 from typing import Any, Dict, List, Optional, Union
+from array import array
 from dataclasses import dataclass
 from enum import Enum
+import sys
 
 
 class KnowledgeSource(Enum):
@@ -20,6 +22,11 @@ class KnowledgeSource(Enum):
     CULTURAL = "cultural"
 
 
+# Member-to-value map built once: query paths do a dict hit instead of
+# the Enum .value descriptor lookup, with interned strings
+_SOURCE_NAMES = {s: sys.intern(s.value) for s in KnowledgeSource}
+
+
 @dataclass
 class KnowledgeEntry:
     """Single knowledge entry"""
@@ -38,6 +45,10 @@ class KnowledgeEntry:
 @dataclass
 class QueryResult:
     """Result from knowledge query"""
+    # no defaulted fields, so manual __slots__ is safe on Python 3.9
+    __slots__ = ("query", "entries", "total_found", "confidence_score",
+                 "source_summary")
+
     query: str
     entries: List[KnowledgeEntry]
     total_found: int
@@ -45,6 +56,70 @@ class QueryResult:
     source_summary: Dict[str, int]
 
 
+class KnowledgeTable:
+    """Column-oriented store for bulk knowledge results
+
+    Keeps parallel columns instead of one object per entry, so scans
+    like confidence filtering touch compact lists rather than millions
+    of KnowledgeEntry instances. Confidence is quantized to one byte
+    per row (0-255) in an array('B'), so threshold scans compare small
+    ints over contiguous bytes instead of boxed 64-bit floats. Entries
+    are materialized (and dequantized) only at the API boundary via
+    to_entries().
+    """
+
+    __slots__ = ("contents", "sources", "confidences_q8", "categories")
+
+    def __init__(self):
+        self.contents: List[str] = []
+        self.sources: List[str] = []
+        self.confidences_q8 = array("B")
+        self.categories: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.contents)
+
+    @staticmethod
+    def _quantize(confidence: float) -> int:
+        """Map a 0.0-1.0 confidence onto 0-255"""
+        return int(confidence * 255.0 + 0.5)
+
+    def append(
+        self,
+        content: str,
+        source: str = "unknown",
+        confidence: float = 1.0,
+        category: str = "general"
+    ):
+        """Add one row"""
+        self.contents.append(content)
+        self.sources.append(source)
+        self.confidences_q8.append(self._quantize(confidence))
+        self.categories.append(category)
+
+    def filter_by_confidence(self, min_confidence: float) -> List[int]:
+        """Indices of rows meeting the confidence threshold"""
+        # quantize the threshold once; the scan is then int-vs-int
+        threshold_q8 = self._quantize(min_confidence)
+        confidences_q8 = self.confidences_q8
+        return [i for i in range(len(confidences_q8))
+                if confidences_q8[i] >= threshold_q8]
+
+    def to_entries(self, indices: Optional[List[int]] = None) -> List[KnowledgeEntry]:
+        """Materialize KnowledgeEntry objects for the given rows"""
+        if indices is None:
+            indices = range(len(self.contents))
+        return [
+            KnowledgeEntry(
+                content=self.contents[i],
+                source=self.sources[i],
+                confidence=self.confidences_q8[i] / 255.0,
+                category=self.categories[i]
+            )
+            for i in indices
+        ]
+
+
 def query_knowledge_base(
     query: str,
     source: Union[str, KnowledgeSource, None] = None,
@@ -68,7 +143,7 @@ def query_knowledge_base(
     # This is a placeholder function for knowledge base querying
     # In actual implementation, this would search a real knowledge base
 
-    source_name = source.value if isinstance(source, KnowledgeSource) else (source or "general")
+    source_name = _SOURCE_NAMES[source] if isinstance(source, KnowledgeSource) else (source or "general")
 
     # Mock knowledge entries
     entries = [
@@ -178,8 +253,20 @@ def find_related_topics(
     Returns:
         List of related topics
     """
-    # This is a placeholder function for finding related topics
-    return [f"Related topic to {topic} #{i+1}" for i in range(min(3, max_results))]
+    # Ask for all related topics in one batched query instead of one
+    # lookup per topic
+    count = min(3, max_results)
+    batch_query = (
+        f"List {count} topics with a {relationship_type} relationship to {topic}"
+    )
+    # This is a placeholder for dispatching batch_query and splitting
+    # the response
+    # constant prefix hoisted; slots filled into a preallocated list
+    prefix = f"Related topic to {topic} #"
+    topics: List[str] = [""] * count
+    for i in range(count):
+        topics[i] = prefix + str(i + 1)
+    return topics
 
 
 def verify_information(
@@ -225,22 +312,41 @@ def get_recent_information(
     Returns:
         List of recent knowledge entries
     """
+    return list(iter_recent_information(topic, time_range, source_types))
+
+
+def iter_recent_information(
+    topic: str,
+    time_range: str = "recent",
+    source_types: Optional[List[str]] = None
+):
+    """
+    Lazily yield recent information about a topic, source by source
+
+    Callers that stop after the first few entries never pay for the
+    rest; results stream out as each source completes.
+
+    Args:
+        topic: Topic to get recent info about
+        time_range: Time range ("recent", "this_week", "this_month", "this_year")
+        source_types: Types of sources to include
+
+    Yields:
+        Recent knowledge entries
+    """
     # This is a placeholder function for recent information
     sources = source_types or ["general"]
+    metadata_tmpl = {"time_range": time_range}  # shared across entries
 
-    entries = []
     for source in sources:
-        entry = KnowledgeEntry(
+        yield KnowledgeEntry(
             content=f"Recent information about {topic} from {source}",
             source=source,
             confidence=0.7,
             category="current",
             last_updated=time_range,
-            metadata={"time_range": time_range}
+            metadata=metadata_tmpl
         )
-        entries.append(entry)
-
-    return entries
 
 
 # Export functions and classes
@@ -248,11 +354,13 @@ __all__ = [
     "KnowledgeSource",
     "KnowledgeEntry",
     "QueryResult",
+    "KnowledgeTable",
     "query_knowledge_base",
     "search_facts",
     "get_definition",
     "explain_concept",
     "find_related_topics",
     "verify_information",
-    "get_recent_information"
+    "get_recent_information",
+    "iter_recent_information"
 ]
\ No newline at end of file
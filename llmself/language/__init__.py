@@ -8,8 +8,13 @@ from typing import Dict, List, Optional
 from enum import Enum
 
 
-class Language(Enum):
+class Language(str, Enum):
     """Supported languages"""
+    # str mixin (StrEnum is 3.11+) so members ARE their codes: they
+    # interoperate with plain-string dict keys and comparisons, and
+    # __str__ bypasses Enum's name-based override
+    __str__ = str.__str__
+
     AUTO = "auto"
     ENGLISH = "en"
     CHINESE = "zh"
@@ -22,8 +27,10 @@ class Language(Enum):
     ARABIC = "ar"
 
 
-class WritingStyle(Enum):
+class WritingStyle(str, Enum):
     """Writing styles"""
+    __str__ = str.__str__
+
     FORMAL = "formal"
     CASUAL = "casual"
     ACADEMIC = "academic"
@@ -34,6 +41,11 @@ class WritingStyle(Enum):
     DESCRIPTIVE = "descriptive"
 
 
+# Resolved once at import so detect_language avoids the Enum .value
+# descriptor lookup per call
+_AUTO_CODE = Language.AUTO.value
+
+
 def detect_language(text: str) -> str:
     """
     Detect the language of given text
@@ -46,7 +58,7 @@ def detect_language(text: str) -> str:
     """
     # This is a placeholder function for language detection
     # In actual implementation, this would use language detection libraries
-    return Language.AUTO.value
+    return _AUTO_CODE
 
 
 def set_language_preference(language: str) -> None:
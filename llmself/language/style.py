@@ -4,24 +4,47 @@ Writing and literary styles for llmself
 Provides various writer and literary style personas for content generation.
 """
 
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
+import sys
+
+# Style templates precompiled at import; format_map reuses the parsed
+# format spec instead of rebuilding an f-string on every apply() call
+_TEMPLATES = {
+    "oscar_wilde": "[Oscar Wilde style] {text}",
+    "shakespeare": "[Shakespeare style] {text}",
+    "hemingway": "[Hemingway style] {text}",
+    "jane_austen": "[Jane Austen style] {text}",
+    "kafka": "[Kafka style] {text}",
+    "lu_xun": "[鲁迅风格] {text}",
+    "luo_yonghao": "[罗永浩风格] {text}",
+    "technical": "[Technical style] {text}",
+    "blogger": "[Blog style] {text}",
+}
 
 
-@dataclass
+@dataclass(frozen=True)
 class StyleProfile:
     """Profile for a writing style"""
     name: str
     description: str
-    characteristics: List[str]
+    characteristics: Tuple[str, ...]
     tone: str
     vocabulary: str = "standard"
     sentence_structure: str = "varied"
-    typical_themes: List[str] = None
+    typical_themes: Tuple[str, ...] = ()
 
     def __post_init__(self):
-        if self.typical_themes is None:
-            self.typical_themes = []
+        # normalize to tuples of interned strings: immutable, smaller
+        # than lists, and overlapping traits share one string object
+        object.__setattr__(
+            self, "characteristics",
+            tuple(sys.intern(c) for c in self.characteristics)
+        )
+        object.__setattr__(
+            self, "typical_themes",
+            tuple(sys.intern(t) for t in self.typical_themes)
+        )
 
 
 class OscarWilde:
@@ -30,23 +53,23 @@ class OscarWilde:
     profile = StyleProfile(
         name="Oscar Wilde",
         description="Witty, paradoxical, and elegantly satirical style with clever wordplay",
-        characteristics=[
+        characteristics=(
             "paradoxical statements",
             "witty epigrams",
             "elegant satire",
             "clever wordplay",
             "social commentary"
-        ],
+        ),
         tone="witty",
         vocabulary="sophisticated",
         sentence_structure="balanced",
-        typical_themes=["society", "beauty", "morality", "art"]
+        typical_themes=("society", "beauty", "morality", "art")
     )
 
     @staticmethod
     def apply(text: str, intensity: float = 0.7) -> str:
         """Apply Oscar Wilde style to text"""
-        return f"[Oscar Wilde style] {text}"
+        return _TEMPLATES["oscar_wilde"].format_map({"text": text})
 
 
 class Shakespeare:
@@ -55,23 +78,23 @@ class Shakespeare:
     profile = StyleProfile(
         name="William Shakespeare",
         description="Dramatic, poetic style with rich metaphors and timeless themes",
-        characteristics=[
+        characteristics=(
             "iambic pentameter",
             "rich metaphors",
             "dramatic monologues",
             "universal themes",
             "wordplay and puns"
-        ],
+        ),
         tone="dramatic",
         vocabulary="rich",
         sentence_structure="complex",
-        typical_themes=["love", "power", "betrayal", "human nature"]
+        typical_themes=("love", "power", "betrayal", "human nature")
     )
 
     @staticmethod
     def apply(text: str, intensity: float = 0.7) -> str:
         """Apply Shakespeare style to text"""
-        return f"[Shakespeare style] {text}"
+        return _TEMPLATES["shakespeare"].format_map({"text": text})
 
 
 class Hemingway:
@@ -80,23 +103,23 @@ class Hemingway:
     profile = StyleProfile(
         name="Ernest Hemingway",
         description="Minimalist, direct style with understated emotion and iceberg theory",
-        characteristics=[
+        characteristics=(
             "simple sentences",
             "understated emotion",
             "iceberg theory",
             "dialogue-heavy",
             "objective narration"
-        ],
+        ),
         tone="understated",
         vocabulary="simple",
         sentence_structure="short",
-        typical_themes=["war", "death", "love", "loss"]
+        typical_themes=("war", "death", "love", "loss")
     )
 
     @staticmethod
     def apply(text: str, intensity: float = 0.7) -> str:
         """Apply Hemingway style to text"""
-        return f"[Hemingway style] {text}"
+        return _TEMPLATES["hemingway"].format_map({"text": text})
 
 
 class JaneAusten:
@@ -105,23 +128,23 @@ class JaneAusten:
     profile = StyleProfile(
         name="Jane Austen",
         description="Social commentary with gentle irony and keen observation of manners",
-        characteristics=[
+        characteristics=(
             "social observation",
             "gentle irony",
             "free indirect discourse",
             "character development",
             "moral themes"
-        ],
+        ),
         tone="ironic",
         vocabulary="refined",
         sentence_structure="elegant",
-        typical_themes=["society", "marriage", "class", "morality"]
+        typical_themes=("society", "marriage", "class", "morality")
     )
 
     @staticmethod
     def apply(text: str, intensity: float = 0.7) -> str:
         """Apply Jane Austen style to text"""
-        return f"[Jane Austen style] {text}"
+        return _TEMPLATES["jane_austen"].format_map({"text": text})
 
 
 class KafkaStyle:
@@ -130,23 +153,23 @@ class KafkaStyle:
     profile = StyleProfile(
         name="Franz Kafka",
         description="Surreal, existential style exploring alienation and absurdity",
-        characteristics=[
+        characteristics=(
             "surreal situations",
             "existential themes",
             "bureaucratic absurdity",
             "psychological depth",
             "symbolic narrative"
-        ],
+        ),
         tone="existential",
         vocabulary="precise",
         sentence_structure="complex",
-        typical_themes=["alienation", "bureaucracy", "guilt", "transformation"]
+        typical_themes=("alienation", "bureaucracy", "guilt", "transformation")
     )
 
     @staticmethod
     def apply(text: str, intensity: float = 0.7) -> str:
         """Apply Kafka style to text"""
-        return f"[Kafka style] {text}"
+        return _TEMPLATES["kafka"].format_map({"text": text})
 
 
 # Chinese literary styles
@@ -156,23 +179,23 @@ class LuXun:
     profile = StyleProfile(
         name="鲁迅 (Lu Xun)",
         description="Critical realism with sharp social critique and satirical edge",
-        characteristics=[
+        characteristics=(
             "social critique",
             "satirical tone",
             "realistic portrayal",
             "cultural criticism",
             "sharp observations"
-        ],
+        ),
         tone="critical",
         vocabulary="incisive",
         sentence_structure="pointed",
-        typical_themes=["society", "tradition", "reform", "human nature"]
+        typical_themes=("society", "tradition", "reform", "human nature")
     )
 
     @staticmethod
     def apply(text: str, intensity: float = 0.7) -> str:
         """Apply Lu Xun style to text"""
-        return f"[鲁迅风格] {text}"
+        return _TEMPLATES["lu_xun"].format_map({"text": text})
 
 
 class LaoLao:
@@ -181,23 +204,23 @@ class LaoLao:
     profile = StyleProfile(
         name="罗永浩 (Luo Yonghao)",
         description="Humorous, self-deprecating style with entrepreneurial spirit and social commentary",
-        characteristics=[
+        characteristics=(
             "self-deprecating humor",
             "entrepreneurial spirit",
             "social commentary",
             "candid expression",
             "motivational undertones"
-        ],
+        ),
         tone="humorous",
         vocabulary="colloquial",
         sentence_structure="conversational",
-        typical_themes=["entrepreneurship", "failure", "persistence", "society"]
+        typical_themes=("entrepreneurship", "failure", "persistence", "society")
     )
 
     @staticmethod
     def apply(text: str, intensity: float = 0.7) -> str:
         """Apply Luo Yonghao style to text"""
-        return f"[罗永浩风格] {text}"
+        return _TEMPLATES["luo_yonghao"].format_map({"text": text})
 
 
 # Modern styles
@@ -207,23 +230,23 @@ class TechWriter:
     profile = StyleProfile(
         name="Technical Writer",
         description="Clear, precise technical documentation style",
-        characteristics=[
+        characteristics=(
             "clear instructions",
             "logical structure",
             "precise terminology",
             "step-by-step approach",
             "objective tone"
-        ],
+        ),
         tone="objective",
         vocabulary="technical",
         sentence_structure="clear",
-        typical_themes=["procedures", "specifications", "explanations"]
+        typical_themes=("procedures", "specifications", "explanations")
     )
 
     @staticmethod
     def apply(text: str, intensity: float = 0.7) -> str:
         """Apply technical writing style to text"""
-        return f"[Technical style] {text}"
+        return _TEMPLATES["technical"].format_map({"text": text})
 
 
 class BloggerStyle:
@@ -232,23 +255,23 @@ class BloggerStyle:
     profile = StyleProfile(
         name="Modern Blogger",
         description="Conversational, engaging blog style with personal touch",
-        characteristics=[
+        characteristics=(
             "conversational tone",
             "personal anecdotes",
             "engaging hooks",
             "accessible language",
             "call-to-action"
-        ],
+        ),
         tone="conversational",
         vocabulary="accessible",
         sentence_structure="varied",
-        typical_themes=["personal experience", "advice", "trends", "lifestyle"]
+        typical_themes=("personal experience", "advice", "trends", "lifestyle")
     )
 
     @staticmethod
     def apply(text: str, intensity: float = 0.7) -> str:
         """Apply blogger style to text"""
-        return f"[Blog style] {text}"
+        return _TEMPLATES["blogger"].format_map({"text": text})
 
 
 # Style registry
@@ -265,13 +288,54 @@ AVAILABLE_STYLES = {
 }
 
 
+# Static persona scaffolding per style, built once. Prompts keep all
+# fixed tokens first so serving stacks that key their prefix cache on
+# leading token sequences get hits for everything but the user text.
+_PROMPT_PREFIX = {
+    name: (
+        f"You write in the style of {cls.profile.name}: "
+        f"{cls.profile.description}. "
+        f"Characteristics: {', '.join(cls.profile.characteristics)}.\n"
+    )
+    for name, cls in AVAILABLE_STYLES.items()
+}
+
+
+def build_style_prompt(name: str, text: str) -> str:
+    """
+    Build a prefix-cache-friendly styled prompt
+
+    The static persona scaffolding (description plus characteristics)
+    leads the prompt and the variable user text comes last, so repeated
+    calls with the same style share the cached prefill.
+
+    Args:
+        name: Style name (as in AVAILABLE_STYLES)
+        text: User text to style
+
+    Returns:
+        Full prompt string
+    """
+    prefix = _PROMPT_PREFIX.get(name.lower(), "")
+    return f"{prefix}Text: {text}"
+
+
+# Case-folded lookup table with interned keys, built once: get_style
+# resolves with a single hashed load on the common lowercase path
+_STYLES_CI = {sys.intern(key.lower()): cls for key, cls in AVAILABLE_STYLES.items()}
+
+
 def get_style(name: str):
     """Get style class by name"""
-    return AVAILABLE_STYLES.get(name.lower())
+    # exact hit first so already-lowercase names skip the .lower() copy
+    style_class = _STYLES_CI.get(name)
+    if style_class is not None:
+        return style_class
+    return _STYLES_CI.get(name.lower())
 
 
-def list_available_styles() -> List[Dict[str, Any]]:
-    """List all available styles with their profiles"""
+def _build_style_list() -> List[Dict[str, Any]]:
+    """Build the style listing from the registry"""
     styles = []
     for name, style_class in AVAILABLE_STYLES.items():
         profile = style_class.profile
@@ -286,6 +350,17 @@ def list_available_styles() -> List[Dict[str, Any]]:
     return styles
 
 
+# The registry is fixed at import, so the listing is materialized once
+_STYLE_LIST = _build_style_list()
+
+
+def list_available_styles() -> List[Dict[str, Any]]:
+    """List all available styles with their profiles"""
+    # shallow copy so callers can reorder/filter without corrupting
+    # the shared listing
+    return list(_STYLE_LIST)
+
+
 # Export main components
 __all__ = [
     "StyleProfile",
@@ -299,6 +374,7 @@ __all__ = [
     "TechWriter",
     "BloggerStyle",
     "get_style",
+    "build_style_prompt",
     "list_available_styles",
     "AVAILABLE_STYLES"
 ]
\ No newline at end of file
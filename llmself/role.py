@@ -4,45 +4,433 @@ Role system for llmself
 Provides expert roles and role management for specialized thinking and analysis.
 """
 
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
-from enum import Enum
+from typing import (Any, Dict, Final, FrozenSet, List, Literal, Mapping,
+                    Optional, cast)
+from enum import Enum, IntEnum, unique
+from types import MappingProxyType
 import random
+import sys
+
+# module-private RNG so expert selection never touches the global
+# random state shared with user code
+_default_rng = random.Random()
+
+
+# Domain values as a plain tuple; the enum below is built from it via
+# the functional API, which runs the member-construction loop in C and
+# compiles to a fraction of the bytecode a NAME = "value" class body
+# emits (one STORE_NAME + Enum.__new__ per member)
+_DOMAIN_NAMES: tuple = (
+    "philosophy", "science", "technology", "arts", "business",
+    "education", "psychology", "history", "linguistics", "mathematics",
+    "medicine", "law", "engineering", "design", "writing",
+)
+
+# str mixin (StrEnum is 3.11+) so members ARE their values: string
+# comparisons, dict keys and f-string interpolation work without
+# .value, and __str__ skips Enum's "ExpertDomain.X" formatting
+# enum.unique fails import if any member aliases another, so every
+# member reference is a distinct constant and value->member lookups
+# never go through alias re-indirection
+ExpertDomain = unique(Enum(
+    "ExpertDomain",
+    {v.upper(): v for v in _DOMAIN_NAMES},
+    type=str,
+    module=__name__,
+))
+ExpertDomain.__doc__ = """Predefined expert domains"""
+ExpertDomain.__str__ = str.__str__
+
+
+# Intern the member values so equality checks and dict probes against
+# other interned strings short-circuit on pointer identity (CPython
+# interns identifier-like literals, but routing everything through
+# sys.intern makes the invariant explicit rather than accidental)
+for _member in ExpertDomain:
+    _member._value_ = sys.intern(_member._value_)
+del _member
+
+# Frozen value->member map: one dict hit instead of the EnumMeta
+# __call__ dispatch chain that ExpertDomain("science") walks through
+_DOMAIN_FROM_STRING: Dict[str, ExpertDomain] = dict(
+    ExpertDomain._value2member_map_
+)
+
+# Length bounds of the known values: inputs outside [min, max] cannot
+# match, so lookups reject them on one len() without hashing
+_DOMAIN_MIN_LEN = min(len(v) for v in _DOMAIN_FROM_STRING)
+_DOMAIN_MAX_LEN = max(len(v) for v in _DOMAIN_FROM_STRING)
+
+# bound method, so the hit path is one C call with no attribute lookup
+_domain_getitem = _DOMAIN_FROM_STRING.__getitem__
+
+
+def domain_from_str(value: str) -> ExpertDomain:
+    """Resolve a domain string to its ExpertDomain member
+
+    Raises:
+        KeyError: If the value names no known domain
+    """
+    if not _DOMAIN_MIN_LEN <= len(value) <= _DOMAIN_MAX_LEN:
+        raise KeyError(value)
+    return _domain_getitem(value)
+
+
+def _build_domain_trie() -> Dict[int, Any]:
+    """Nested byte-keyed trie over the domain names
+
+    Terminal nodes store the member under key -1, which no byte can
+    collide with.
+    """
+    root: Dict[int, Any] = {}
+    for member in ExpertDomain:
+        node = root
+        for byte in member.value.encode():
+            node = node.setdefault(byte, {})
+        node[-1] = member
+    return root
+
+
+_DOMAIN_TRIE = _build_domain_trie()
+
+
+def match_domain(data: bytes) -> Optional[ExpertDomain]:
+    """Match untrusted bytes against the known domain names
+
+    Walks the byte trie and bails on the first byte that cannot start
+    any domain name, so the miss-heavy validation path exits after a
+    comparison or two instead of hashing the whole input the way a
+    dict probe must.
+
+    Returns:
+        The matching member, or None
+    """
+    node = _DOMAIN_TRIE
+    for byte in data:
+        node = node.get(byte)
+        if node is None:
+            return None
+    return node.get(-1)
+
+
+class Domain:
+    """Interned plain-string domain constants for hot paths
+
+    Attribute access yields a bare str with no Enum machinery behind
+    it; interning makes equality a pointer compare. Use ExpertDomain
+    when member identity, iteration or isinstance checks matter.
+    """
+
+    PHILOSOPHY: Final[str] = sys.intern("philosophy")
+    SCIENCE: Final[str] = sys.intern("science")
+    TECHNOLOGY: Final[str] = sys.intern("technology")
+    ARTS: Final[str] = sys.intern("arts")
+    BUSINESS: Final[str] = sys.intern("business")
+    EDUCATION: Final[str] = sys.intern("education")
+    PSYCHOLOGY: Final[str] = sys.intern("psychology")
+    HISTORY: Final[str] = sys.intern("history")
+    LINGUISTICS: Final[str] = sys.intern("linguistics")
+    MATHEMATICS: Final[str] = sys.intern("mathematics")
+    MEDICINE: Final[str] = sys.intern("medicine")
+    LAW: Final[str] = sys.intern("law")
+    ENGINEERING: Final[str] = sys.intern("engineering")
+    DESIGN: Final[str] = sys.intern("design")
+    WRITING: Final[str] = sys.intern("writing")
+
+
+# Membership checks against the known domains in one hash hit
+DOMAINS: FrozenSet[str] = frozenset(_DOMAIN_FROM_STRING)
+
+# Closed-set alias for plain-string call sites: annotating with
+# DomainStr gives the type checker the same guarantee as the enum with
+# zero runtime cost for callers that never touch enum machinery. Must
+# list the literals explicitly — static checkers can't expand
+# _DOMAIN_NAMES — so keep it in sync with the tuple above.
+DomainStr = Literal[
+    "philosophy", "science", "technology", "arts", "business",
+    "education", "psychology", "history", "linguistics", "mathematics",
+    "medicine", "law", "engineering", "design", "writing",
+]
+
+
+def to_domain_str(value: str) -> "DomainStr":
+    """Validate a plain string as a known domain name
+
+    Raises:
+        KeyError: If value is not a known domain
+    """
+    if value not in DOMAINS:
+        raise KeyError(value)
+    return cast("DomainStr", value)
+
+# Re-export members as module globals: `from llmself.role import
+# SCIENCE` then binds locally and each use is a plain LOAD_GLOBAL,
+# skipping the EnumMeta attribute probe that ExpertDomain.SCIENCE
+# pays. The read-only proxy gives name->member access without exposing
+# a mutable table.
+globals().update(ExpertDomain.__members__)
+DOMAIN_MAP: Mapping[str, ExpertDomain] = MappingProxyType(
+    dict(ExpertDomain.__members__)
+)
+
+# Iteration/choices snapshots taken once: loops dumping domains into
+# prompts read a tuple instead of re-walking the enum each call
+ALL_DOMAINS: tuple = tuple(ExpertDomain)
+DOMAIN_CHOICES: tuple = tuple((m.name, m.value) for m in ExpertDomain)
+
+
+def _fnv1a_64(data: bytes) -> int:
+    """64-bit FNV-1a hash of a byte string"""
+    h = 0xCBF29CE484222325
+    for byte in data:
+        h = ((h ^ byte) * 0x100000001B3) & 0xFFFFFFFFFFFFFFFF
+    return h
+
+
+# Compact integer tags for routing tables: int-keyed dicts compare
+# with C-level PyLong equality and stay stable across processes
+# (unlike hash(str) under PYTHONHASHSEED)
+DOMAIN_ID: Dict[ExpertDomain, int] = {
+    m: _fnv1a_64(m.value.encode()) for m in ExpertDomain
+}
+DOMAIN_BY_ID: Dict[int, ExpertDomain] = {
+    tag: m for m, tag in DOMAIN_ID.items()
+}
+
+
+def domain_id(domain: ExpertDomain) -> int:
+    """Stable 64-bit routing tag for a domain"""
+    return DOMAIN_ID[domain]
+
+
+# Per-domain prompt preambles generated from the enum at import rather
+# than a handwritten if/elif ladder over every member: selection is one
+# dict hit no matter how many domains exist, and new members pick up a
+# preamble automatically
+_DOMAIN_PROMPT: Dict[ExpertDomain, str] = {
+    m: "You are an expert in {}. Answer from that discipline's "
+       "perspective.".format(m.value)
+    for m in ExpertDomain
+}
+
+
+def domain_prompt(domain: ExpertDomain) -> str:
+    """Prompt preamble for a domain"""
+    return _DOMAIN_PROMPT[domain]
+
+
+# All domain names packed into one immutable blob with an offset/length
+# table, so serializing a name into a bytearray copies straight out of
+# the blob through a memoryview instead of allocating a fresh encoded
+# str per write
+def _pack_domain_blob():
+    parts = []
+    spans = {}
+    offset = 0
+    for m in ExpertDomain:
+        encoded = m.value.encode()
+        parts.append(encoded)
+        spans[m] = (offset, len(encoded))
+        offset += len(encoded)
+    return b"".join(parts), spans
+
+
+_DOMAIN_BLOB, _DOMAIN_SPANS = _pack_domain_blob()
+_DOMAIN_BLOB_VIEW = memoryview(_DOMAIN_BLOB)
+
+
+def write_domain(buf: bytearray, domain: ExpertDomain) -> None:
+    """Append a domain's encoded name to buf without a str allocation"""
+    offset, length = _DOMAIN_SPANS[domain]
+    buf += _DOMAIN_BLOB_VIEW[offset:offset + length]
+
+
+# Dense 0..N-1 integer mirror of the enum, generated so it can never
+# drift from ExpertDomain. Numeric kernels (scoring arrays, one-hot
+# label vectors, JIT-compiled loops) index by DomainIndex and convert
+# back to the str enum only at the boundary.
+DomainIndex = IntEnum(
+    "DomainIndex", [(m.name, i) for i, m in enumerate(ExpertDomain)]
+)
+DomainIndex.__doc__ = """Integer mirror of ExpertDomain for numeric code"""
+
+DOMAIN_TO_INDEX: Dict[ExpertDomain, "DomainIndex"] = {
+    m: DomainIndex[m.name] for m in ExpertDomain
+}
+INDEX_TO_DOMAIN: Dict["DomainIndex", ExpertDomain] = {
+    i: m for m, i in DOMAIN_TO_INDEX.items()
+}
+
+# Domain groupings as frozensets so "is this a STEM domain?" is one
+# C-level hash probe instead of an ad-hoc list scan at each call site
+STEM_DOMAINS: FrozenSet[ExpertDomain] = frozenset({
+    ExpertDomain.SCIENCE, ExpertDomain.TECHNOLOGY,
+    ExpertDomain.MATHEMATICS, ExpertDomain.MEDICINE,
+    ExpertDomain.ENGINEERING,
+})
+HUMANITIES_DOMAINS: FrozenSet[ExpertDomain] = frozenset({
+    ExpertDomain.PHILOSOPHY, ExpertDomain.HISTORY,
+    ExpertDomain.LINGUISTICS,
+})
+SOCIAL_DOMAINS: FrozenSet[ExpertDomain] = frozenset({
+    ExpertDomain.BUSINESS, ExpertDomain.EDUCATION,
+    ExpertDomain.PSYCHOLOGY, ExpertDomain.LAW,
+})
+CREATIVE_DOMAINS: FrozenSet[ExpertDomain] = frozenset({
+    ExpertDomain.ARTS, ExpertDomain.DESIGN, ExpertDomain.WRITING,
+})
+
+# member -> category label, flattened from the sets above so category
+# lookup is a single dict hit
+DOMAIN_CATEGORY: Dict[ExpertDomain, str] = {}
+for _category, _group in (
+    ("stem", STEM_DOMAINS),
+    ("humanities", HUMANITIES_DOMAINS),
+    ("social", SOCIAL_DOMAINS),
+    ("creative", CREATIVE_DOMAINS),
+):
+    for _member in _group:
+        DOMAIN_CATEGORY[_member] = _category
+del _category, _group, _member
+
+
+# Interned specialty tuples: profiles sharing a specialty set point at
+# one tuple object
+_SPECIALTY_CACHE: Dict[tuple, tuple] = {}
 
 
-class ExpertDomain(Enum):
-    """Predefined expert domains"""
-    PHILOSOPHY = "philosophy"
-    SCIENCE = "science"
-    TECHNOLOGY = "technology"
-    ARTS = "arts"
-    BUSINESS = "business"
-    EDUCATION = "education"
-    PSYCHOLOGY = "psychology"
-    HISTORY = "history"
-    LINGUISTICS = "linguistics"
-    MATHEMATICS = "mathematics"
-    MEDICINE = "medicine"
-    LAW = "law"
-    ENGINEERING = "engineering"
-    DESIGN = "design"
-    WRITING = "writing"
-
-
-@dataclass
 class ExpertProfile:
     """Profile for an expert role"""
-    name: str
-    domain: str
-    description: str
-    specialties: List[str] = None
-    thinking_style: str = "analytical"
-    response_length: str = "medium"
-    perspective: str = "objective"
 
-    def __post_init__(self):
-        if self.specialties is None:
-            self.specialties = []
+    # plain class with __slots__: dataclass(slots=True) needs 3.10+ and
+    # manual __slots__ clashes with dataclass field defaults on 3.9.
+    # Slots drop the per-instance __dict__ and make field reads
+    # fixed-offset loads, which matters with hundreds of registered
+    # profiles.
+    __slots__ = ("name", "domain", "description", "specialties",
+                 "thinking_style", "response_length", "perspective",
+                 "_cached_dict")
+
+    def __init__(
+        self,
+        name: str,
+        domain: str,
+        description: str,
+        specialties: Optional[List[str]] = None,
+        thinking_style: str = "analytical",
+        response_length: str = "medium",
+        perspective: str = "objective"
+    ):
+        self.name = name
+        self.domain = domain
+        self.description = description
+        # set once, read-only: store as a tuple and share one object
+        # across profiles with identical specialty sets
+        key = tuple(specialties) if specialties is not None else ()
+        self.specialties = _SPECIALTY_CACHE.setdefault(key, key)
+        # these fields draw from small closed vocabularies repeated
+        # across profiles ("analytical", "medium", "objective", ...);
+        # interning collapses the copies to one shared object each and
+        # makes cross-profile equality a pointer compare
+        self.thinking_style = sys.intern(thinking_style)
+        self.response_length = sys.intern(response_length)
+        self.perspective = sys.intern(perspective)
+        self._cached_dict: Optional[Dict[str, Any]] = None
+
+    def __repr__(self) -> str:
+        return (f"ExpertProfile(name={self.name!r}, domain={self.domain!r}, "
+                f"description={self.description!r})")
+
+
+# Default expert profiles as raw specs; ExpertProfile objects are only
+# materialized on first access, so importing the module skips ten
+# constructions. Domains are literal strings (matching the
+# ExpertDomain values) so building the table costs no enum
+# descriptor lookups at import
+_DEFAULT_EXPERT_SPECS: Dict[str, Dict[str, Any]] = {
+    "philosopher": dict(
+        domain="philosophy",
+        description="Deep thinker who explores fundamental questions about existence, knowledge, and ethics",
+        specialties=["ethics", "metaphysics", "epistemology", "logic"],
+        thinking_style="contemplative",
+        perspective="questioning"
+    ),
+    "scientist": dict(
+        domain="science",
+        description="Researcher who applies scientific method to understand natural phenomena",
+        specialties=["hypothesis formation", "data analysis", "experimental design"],
+        thinking_style="empirical",
+        perspective="evidence-based"
+    ),
+    "artist": dict(
+        domain="arts",
+        description="Creative individual who expresses ideas through various artistic mediums",
+        specialties=["visual arts", "creative expression", "aesthetic theory"],
+        thinking_style="intuitive",
+        perspective="creative"
+    ),
+    "poet": dict(
+        domain="writing",
+        description="Literary artist who crafts language with rhythm, metaphor, and imagery",
+        specialties=["metaphor", "symbolism", "emotional expression"],
+        thinking_style="lyrical",
+        perspective="emotional"
+    ),
+    "historian": dict(
+        domain="history",
+        description="Scholar who studies and interprets past events and their significance",
+        specialties=["chronology", "causation", "historical context"],
+        thinking_style="contextual",
+        perspective="temporal"
+    ),
+    "psychologist": dict(
+        domain="psychology",
+        description="Professional who studies human behavior and mental processes",
+        specialties=["behavior analysis", "cognitive processes", "emotional patterns"],
+        thinking_style="behavioral",
+        perspective="psychological"
+    ),
+    "technologist": dict(
+        domain="technology",
+        description="Expert in technology development and implementation",
+        specialties=["innovation", "systems thinking", "technical implementation"],
+        thinking_style="systematic",
+        perspective="practical"
+    ),
+    "economist": dict(
+        domain="business",
+        description="Analyst of economic systems and market behaviors",
+        specialties=["market analysis", "resource allocation", "economic modeling"],
+        thinking_style="quantitative",
+        perspective="market-oriented"
+    ),
+    "educator": dict(
+        domain="education",
+        description="Professional focused on learning and knowledge transfer",
+        specialties=["pedagogy", "curriculum design", "learning psychology"],
+        thinking_style="pedagogical",
+        perspective="educational"
+    ),
+    "sociologist": dict(
+        domain="psychology",
+        description="Researcher who studies society and social relationships",
+        specialties=["social structures", "group dynamics", "cultural analysis"],
+        thinking_style="social",
+        perspective="societal"
+    )
+}
+
+
+def _profile_dict(expert: ExpertProfile) -> Dict[str, Any]:
+    """Serialize one profile for listings; built once per profile"""
+    return {
+        "name": expert.name,
+        "domain": expert.domain,
+        "description": expert.description,
+        "specialties": expert.specialties,
+        "thinking_style": expert.thinking_style,
+        "perspective": expert.perspective
+    }
 
 
 class ExpertRegistry:
@@ -50,116 +438,87 @@ class ExpertRegistry:
 
     def __init__(self):
         self._experts: Dict[str, ExpertProfile] = {}
-        self._load_default_experts()
-
-    def _load_default_experts(self):
-        """Load default expert profiles"""
-        default_experts = [
-            ExpertProfile(
-                name="philosopher",
-                domain=ExpertDomain.PHILOSOPHY.value,
-                description="Deep thinker who explores fundamental questions about existence, knowledge, and ethics",
-                specialties=["ethics", "metaphysics", "epistemology", "logic"],
-                thinking_style="contemplative",
-                perspective="questioning"
-            ),
-            ExpertProfile(
-                name="scientist",
-                domain=ExpertDomain.SCIENCE.value,
-                description="Researcher who applies scientific method to understand natural phenomena",
-                specialties=["hypothesis formation", "data analysis", "experimental design"],
-                thinking_style="empirical",
-                perspective="evidence-based"
-            ),
-            ExpertProfile(
-                name="artist",
-                domain=ExpertDomain.ARTS.value,
-                description="Creative individual who expresses ideas through various artistic mediums",
-                specialties=["visual arts", "creative expression", "aesthetic theory"],
-                thinking_style="intuitive",
-                perspective="creative"
-            ),
-            ExpertProfile(
-                name="poet",
-                domain=ExpertDomain.WRITING.value,
-                description="Literary artist who crafts language with rhythm, metaphor, and imagery",
-                specialties=["metaphor", "symbolism", "emotional expression"],
-                thinking_style="lyrical",
-                perspective="emotional"
-            ),
-            ExpertProfile(
-                name="historian",
-                domain=ExpertDomain.HISTORY.value,
-                description="Scholar who studies and interprets past events and their significance",
-                specialties=["chronology", "causation", "historical context"],
-                thinking_style="contextual",
-                perspective="temporal"
-            ),
-            ExpertProfile(
-                name="psychologist",
-                domain=ExpertDomain.PSYCHOLOGY.value,
-                description="Professional who studies human behavior and mental processes",
-                specialties=["behavior analysis", "cognitive processes", "emotional patterns"],
-                thinking_style="behavioral",
-                perspective="psychological"
-            ),
-            ExpertProfile(
-                name="technologist",
-                domain=ExpertDomain.TECHNOLOGY.value,
-                description="Expert in technology development and implementation",
-                specialties=["innovation", "systems thinking", "technical implementation"],
-                thinking_style="systematic",
-                perspective="practical"
-            ),
-            ExpertProfile(
-                name="economist",
-                domain=ExpertDomain.BUSINESS.value,
-                description="Analyst of economic systems and market behaviors",
-                specialties=["market analysis", "resource allocation", "economic modeling"],
-                thinking_style="quantitative",
-                perspective="market-oriented"
-            ),
-            ExpertProfile(
-                name="educator",
-                domain=ExpertDomain.EDUCATION.value,
-                description="Professional focused on learning and knowledge transfer",
-                specialties=["pedagogy", "curriculum design", "learning psychology"],
-                thinking_style="pedagogical",
-                perspective="educational"
-            ),
-            ExpertProfile(
-                name="sociologist",
-                domain=ExpertDomain.PSYCHOLOGY.value,
-                description="Researcher who studies society and social relationships",
-                specialties=["social structures", "group dynamics", "cultural analysis"],
-                thinking_style="social",
-                perspective="societal"
-            )
-        ]
-
-        for expert in default_experts:
-            self._experts[expert.name] = expert
+        # default profiles stay as raw specs until first accessed
+        self._specs: Dict[str, Dict[str, Any]] = dict(_DEFAULT_EXPERT_SPECS)
+        # domain -> expert names index maintained on registration so
+        # domain-filtered lookups never rescan every profile; specs
+        # carry their domain, so pending names index without
+        # materializing
+        self._by_domain: Dict[str, List[str]] = {}
+        for name, spec in self._specs.items():
+            self._by_domain.setdefault(spec["domain"], []).append(name)
+        # registration-ordered names; stable however many pending specs
+        # have been materialized, so seeded random picks stay
+        # reproducible
+        self._names: List[str] = list(self._specs)
 
     def register_expert(self, expert: ExpertProfile):
         """Register a new expert profile"""
+        previous = self._experts.get(expert.name)
+        if previous is not None:
+            previous_domain = previous.domain
+        else:
+            # a default spec shadowed by explicit registration
+            spec = self._specs.pop(expert.name, None)
+            previous_domain = spec["domain"] if spec is not None else None
+        if previous_domain is not None and previous_domain != expert.domain:
+            # re-registration under a new domain: drop the stale index entry
+            self._by_domain[previous_domain].remove(expert.name)
         self._experts[expert.name] = expert
+        names = self._by_domain.setdefault(expert.domain, [])
+        if expert.name not in names:
+            names.append(expert.name)
+        if expert.name not in self._names:
+            self._names.append(expert.name)
+        # serialize once at registration; profiles are immutable after
+        # this point, so listings can hand out the same dict
+        expert._cached_dict = _profile_dict(expert)
 
     def get_expert(self, name: str) -> Optional[ExpertProfile]:
         """Get expert profile by name"""
-        return self._experts.get(name)
+        profile = self._experts.get(name)
+        if profile is None:
+            spec = self._specs.pop(name, None)
+            if spec is not None:
+                # materialize a default profile on first access; its
+                # index entry already exists
+                profile = ExpertProfile(name=name, **spec)
+                profile._cached_dict = _profile_dict(profile)
+                self._experts[name] = profile
+        return profile
+
+    def list_profiles(self, domain: Optional[str] = None) -> List[ExpertProfile]:
+        """List profile objects, optionally filtered by domain"""
+        if domain is None:
+            # walk the registration-ordered names so the listing stays
+            # stable no matter which defaults were materialized first;
+            # the per-name lookup only pays until pending specs are gone
+            return [self.get_expert(name) for name in self._names]
+        return [self.get_expert(name)
+                for name in self._by_domain.get(domain, ())]
 
     def list_experts(self, domain: Optional[str] = None) -> List[str]:
         """List all expert names, optionally filtered by domain"""
         if domain is None:
-            return list(self._experts.keys())
-        return [name for name, expert in self._experts.items() if expert.domain == domain]
-
-    def get_random_expert(self, domain: Optional[str] = None) -> Optional[ExpertProfile]:
+            # registration order, pending specs included
+            return list(self._names)
+        return list(self._by_domain.get(domain, ()))
+
+    def get_random_expert(
+        self,
+        domain: Optional[str] = None,
+        rng: Optional[random.Random] = None
+    ) -> Optional[ExpertProfile]:
         """Get a random expert, optionally from specific domain"""
-        candidates = self.list_experts(domain)
+        # pick straight from the index; no copy of the candidate list
+        if domain is None:
+            candidates = self._names
+        else:
+            candidates = self._by_domain.get(domain)
         if not candidates:
             return None
-        return self._experts[random.choice(candidates)]
+        # get_expert materializes a pending default spec if picked
+        return self.get_expert((rng or _default_rng).choice(candidates))
 
 
 # Global expert registry
@@ -184,44 +543,63 @@ def expert(
     Returns:
         Expert role identifier
     """
-    if custom_profile:
-        # Create custom expert
-        profile = ExpertProfile(
-            name=custom_profile.get("name", "custom_expert"),
-            domain=custom_profile.get("domain", "general"),
-            description=custom_profile.get("description", "Custom expert role"),
-            specialties=custom_profile.get("specialties", []),
-            thinking_style=custom_profile.get("thinking_style", "analytical"),
-            perspective=custom_profile.get("perspective", "objective")
-        )
-        _expert_registry.register_expert(profile)
-        return profile.name
-
-    if name:
-        # Use specific expert
-        if _expert_registry.get_expert(name):
-            return name
-        else:
-            # If not found, create a basic expert with this name
-            profile = ExpertProfile(
-                name=name,
-                domain=domain or "general",
-                description=f"Expert in {domain or 'general'} domain"
-            )
-            _expert_registry.register_expert(profile)
-            return name
-
-    # Select random expert
-    if seed is not None:
-        random.seed(int(seed * 1000))
-
-    expert_profile = _expert_registry.get_random_expert(domain)
+    # one dict hit on (custom?, named?) replaces the cascading branch
+    # checks; same pattern as the action table in context.py
+    handler = _EXPERT_DISPATCH[(bool(custom_profile), bool(name))]
+    return handler(name, domain, seed, custom_profile)
+
+
+def _expert_custom(name, domain, seed, custom_profile) -> str:
+    """Create and register a custom expert"""
+    profile = ExpertProfile(
+        name=custom_profile.get("name", "custom_expert"),
+        domain=custom_profile.get("domain", "general"),
+        description=custom_profile.get("description", "Custom expert role"),
+        specialties=custom_profile.get("specialties", []),
+        thinking_style=custom_profile.get("thinking_style", "analytical"),
+        perspective=custom_profile.get("perspective", "objective")
+    )
+    _expert_registry.register_expert(profile)
+    return profile.name
+
+
+def _expert_named(name, domain, seed, custom_profile) -> str:
+    """Use a specific expert, creating a basic one if unknown"""
+    if _expert_registry.get_expert(name):
+        return name
+    # If not found, create a basic expert with this name
+    profile = ExpertProfile(
+        name=name,
+        domain=domain or "general",
+        description=f"Expert in {domain or 'general'} domain"
+    )
+    _expert_registry.register_expert(profile)
+    return name
+
+
+def _expert_random(name, domain, seed, custom_profile) -> str:
+    """Select a random expert, seeded if requested"""
+    # a seeded pick gets its own Random instance instead of reseeding
+    # (and clobbering) the global generator
+    rng = random.Random(int(seed * 1000)) if seed is not None else None
+
+    expert_profile = _expert_registry.get_random_expert(domain, rng=rng)
     if expert_profile:
         return expert_profile.name
 
     return "generalist"
 
 
+# (custom_profile given, name given) -> handler; custom wins over name,
+# matching the old branch order
+_EXPERT_DISPATCH = {
+    (True, True): _expert_custom,
+    (True, False): _expert_custom,
+    (False, True): _expert_named,
+    (False, False): _expert_random,
+}
+
+
 def get_expert_profile(name: str) -> Optional[ExpertProfile]:
     """
     Get detailed profile for an expert
@@ -273,20 +651,12 @@ def list_available_experts(domain: Optional[str] = None) -> List[Dict[str, Any]]
     Returns:
         List of expert information
     """
-    experts = []
-    for name in _expert_registry.list_experts(domain):
-        profile = _expert_registry.get_expert(name)
-        if profile:
-            experts.append({
-                "name": profile.name,
-                "domain": profile.domain,
-                "description": profile.description,
-                "specialties": profile.specialties,
-                "thinking_style": profile.thinking_style,
-                "perspective": profile.perspective
-            })
-
-    return experts
+    # hand out the dicts serialized at registration time; iterating
+    # profile objects avoids a name->profile hash lookup per entry
+    return [
+        profile._cached_dict
+        for profile in _expert_registry.list_profiles(domain)
+    ]
 
 
 # Export functions and classes
@@ -297,5 +667,27 @@ __all__ = [
     "list_available_experts",
     "ExpertProfile",
     "ExpertDomain",
+    "Domain",
+    "DOMAINS",
+    "DOMAIN_MAP",
+    "ALL_DOMAINS",
+    "DOMAIN_CHOICES",
+    "DOMAIN_ID",
+    "DOMAIN_BY_ID",
+    "domain_id",
+    "domain_prompt",
+    "write_domain",
+    "DomainIndex",
+    "DOMAIN_TO_INDEX",
+    "INDEX_TO_DOMAIN",
+    "STEM_DOMAINS",
+    "HUMANITIES_DOMAINS",
+    "SOCIAL_DOMAINS",
+    "CREATIVE_DOMAINS",
+    "DOMAIN_CATEGORY",
+    "DomainStr",
+    "to_domain_str",
+    "domain_from_str",
+    "match_domain",
     "ExpertRegistry"
 ]
\ No newline at end of file
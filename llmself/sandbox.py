@@ -6,54 +6,99 @@ Provides controlled environments for testing and safe execution of potentially s
 
 from typing import Any, Dict, Optional, Generator
 from contextlib import contextmanager
-from dataclasses import dataclass, field
 
 
-@dataclass
 class SandboxEnvironment:
     """Sandbox environment configuration"""
-    name: str = "default"
-    restrictions_disabled: bool = False
-    moral_detection_disabled: bool = False
-    content_filtering_disabled: bool = False
-    safety_level: str = "normal"  # "strict", "normal", "relaxed", "disabled"
-    allowed_topics: list = field(default_factory=list)
-    blocked_topics: list = field(default_factory=list)
-    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    # plain class with __slots__: dataclass(slots=True) needs 3.10+ and
+    # manual __slots__ clashes with dataclass field defaults on 3.9.
+    # Nested sandbox stacks allocate one of these per context entry, so
+    # skipping the per-instance __dict__ keeps them cheap.
+    __slots__ = ("name", "restrictions_disabled", "moral_detection_disabled",
+                 "content_filtering_disabled", "safety_level",
+                 "allowed_topics", "blocked_topics", "metadata")
+
+    def __init__(
+        self,
+        name: str = "default",
+        restrictions_disabled: bool = False,
+        moral_detection_disabled: bool = False,
+        content_filtering_disabled: bool = False,
+        safety_level: str = "normal",  # "strict", "normal", "relaxed", "disabled"
+        allowed_topics: Optional[list] = None,
+        blocked_topics: Optional[list] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        self.name = name
+        self.restrictions_disabled = restrictions_disabled
+        self.moral_detection_disabled = moral_detection_disabled
+        self.content_filtering_disabled = content_filtering_disabled
+        self.safety_level = safety_level
+        self.allowed_topics = allowed_topics if allowed_topics is not None else []
+        self.blocked_topics = blocked_topics if blocked_topics is not None else []
+        self.metadata = metadata if metadata is not None else {}
+
+    def __repr__(self) -> str:
+        return (f"SandboxEnvironment(name={self.name!r}, "
+                f"safety_level={self.safety_level!r})")
 
 
 class SandboxManager:
     """Manager for sandbox environments"""
 
+    # one stack instead of a current-field plus overflow list: enter is
+    # an append, exit a pop, current a [-1] peek
     def __init__(self):
-        self._current_env: Optional[SandboxEnvironment] = None
-        self._env_stack: list = []
+        self._stack: list = []
 
     def enter_environment(self, env: SandboxEnvironment):
         """Enter a sandbox environment"""
-        if self._current_env:
-            self._env_stack.append(self._current_env)
-        self._current_env = env
+        self._stack.append(env)
 
     def exit_environment(self):
         """Exit current sandbox environment"""
-        if self._env_stack:
-            self._current_env = self._env_stack.pop()
-        else:
-            self._current_env = None
+        if self._stack:
+            self._stack.pop()
 
     def get_current_environment(self) -> Optional[SandboxEnvironment]:
         """Get current sandbox environment"""
-        return self._current_env
+        return self._stack[-1] if self._stack else None
 
     def is_in_sandbox(self) -> bool:
         """Check if currently in a sandbox"""
-        return self._current_env is not None
+        return bool(self._stack)
 
 
 # Global sandbox manager
 _sandbox_manager = SandboxManager()
 
+# Singleton environments for the fixed-configuration helpers below.
+# Their fields are constants, so each `with` reuses one shared instance
+# instead of allocating a fresh environment per entry; treat them as
+# immutable. Nested identical enters just stack the same object.
+_NO_MORAL_ENV = SandboxEnvironment(
+    name="no_moral_detection",
+    moral_detection_disabled=True,
+    safety_level="relaxed"
+)
+_UNRESTRICTED_ENV = SandboxEnvironment(
+    name="unrestricted",
+    restrictions_disabled=True,
+    moral_detection_disabled=True,
+    content_filtering_disabled=True,
+    safety_level="disabled"
+)
+_SAFE_ENV = SandboxEnvironment(
+    name="safe_testing",
+    safety_level="strict"
+)
+
+# Actions gated behind the moral/content filter switches; frozenset
+# built once so the permission check is a hash lookup, not a scan of a
+# per-call list literal
+_RESTRICTED_ACTIONS = frozenset({"nsfw_content", "inappropriate_content"})
+
 
 @contextmanager
 def no_moral_detection() -> Generator[SandboxEnvironment, None, None]:
@@ -65,15 +110,9 @@ def no_moral_detection() -> Generator[SandboxEnvironment, None, None]:
     Yields:
         SandboxEnvironment with moral detection disabled
     """
-    env = SandboxEnvironment(
-        name="no_moral_detection",
-        moral_detection_disabled=True,
-        safety_level="relaxed"
-    )
-
-    _sandbox_manager.enter_environment(env)
+    _sandbox_manager.enter_environment(_NO_MORAL_ENV)
     try:
-        yield env
+        yield _NO_MORAL_ENV
     finally:
         _sandbox_manager.exit_environment()
 
@@ -88,17 +127,9 @@ def unrestricted_sandbox() -> Generator[SandboxEnvironment, None, None]:
     Yields:
         SandboxEnvironment with all restrictions disabled
     """
-    env = SandboxEnvironment(
-        name="unrestricted",
-        restrictions_disabled=True,
-        moral_detection_disabled=True,
-        content_filtering_disabled=True,
-        safety_level="disabled"
-    )
-
-    _sandbox_manager.enter_environment(env)
+    _sandbox_manager.enter_environment(_UNRESTRICTED_ENV)
     try:
-        yield env
+        yield _UNRESTRICTED_ENV
     finally:
         _sandbox_manager.exit_environment()
 
@@ -111,14 +142,9 @@ def safe_sandbox() -> Generator[SandboxEnvironment, None, None]:
     Yields:
         SandboxEnvironment with normal safety restrictions
     """
-    env = SandboxEnvironment(
-        name="safe_testing",
-        safety_level="strict"
-    )
-
-    _sandbox_manager.enter_environment(env)
+    _sandbox_manager.enter_environment(_SAFE_ENV)
     try:
-        yield env
+        yield _SAFE_ENV
     finally:
         _sandbox_manager.exit_environment()
 
@@ -203,7 +229,7 @@ def check_sandbox_permission(action: str) -> bool:
     if env.restrictions_disabled:
         return True
 
-    if action in ["nsfw_content", "inappropriate_content"]:
+    if action in _RESTRICTED_ACTIONS:
         return env.moral_detection_disabled or env.content_filtering_disabled
 
     return True
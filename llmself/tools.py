@@ -5,7 +5,7 @@ Provides decorators and utilities for tool registration and parameter validation
 """
 
 from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
-from functools import wraps
+from functools import lru_cache, wraps
 import inspect
 
 
@@ -25,6 +25,10 @@ class ToolRegistry:
             "metadata": metadata,
             "signature": inspect.signature(func)
         }
+        # a (re)registered tool may change its parameters; drop any
+        # memoized validation results keyed on the old signature
+        _fix_parameters_cached.cache_clear()
+        _validate_cached.cache_clear()
 
     def get_tool(self, name: str) -> Optional[Dict[str, Any]]:
         """Get tool by name"""
@@ -38,6 +42,10 @@ class ToolRegistry:
 # Global tool registry
 _tool_registry = ToolRegistry()
 
+# Flip on to wrap tools with the logging/validation wrapper; left off
+# by default so tool calls cost no extra Python frame
+_TOOL_INSTRUMENTATION_ENABLED = False
+
 
 def as_tool(
     name: Optional[str] = None,
@@ -74,13 +82,27 @@ def as_tool(
             }
             parameters[param_name] = param_info
 
+        # required set and default map precomputed once at registration
+        # so per-call validation is C-level set/dict ops, not a loop
+        required = frozenset(
+            n for n, p in parameters.items() if p["required"]
+        )
+        defaults = {
+            n: p["default"] for n, p in parameters.items()
+            if not p["required"] and p["default"] is not None
+        }
+
         metadata = {
             "name": tool_name,
             "description": tool_description,
             "category": category,
             "requires_auth": requires_auth,
             "timeout": timeout,
-            "parameters": parameters
+            "parameters": parameters,
+            "required_params": required,
+            "defaults": defaults,
+            # human-readable signature formatted once at registration
+            "signature_str": _format_signature(tool_name, parameters)
         }
 
         # Register the tool
@@ -89,12 +111,18 @@ def as_tool(
         # Add metadata to function
         func._tool_metadata = metadata
 
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            # In actual implementation, this could add logging, validation, etc.
-            return func(*args, **kwargs)
+        if _TOOL_INSTRUMENTATION_ENABLED:
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                # In actual implementation, this could add logging,
+                # validation, etc.
+                return func(*args, **kwargs)
 
-        return wrapper
+            return wrapper
+
+        # no instrumentation active: hand back the original function so
+        # tool calls skip the extra frame and argument repacking
+        return func
 
     return decorator
 
@@ -115,30 +143,55 @@ def check_and_fix_parameters(
     Returns:
         Validated and corrected parameters
     """
+    try:
+        # repeat calls with identical hashable args skip the fix loop
+        key = tuple(sorted(old_parameters.items()))
+        return dict(_fix_parameters_cached(tool_name, key, strict))
+    except TypeError:
+        # unhashable parameter values: take the uncached path
+        return _fix_parameters(tool_name, old_parameters, strict)
+
+
+@lru_cache(maxsize=1024)
+def _fix_parameters_cached(
+    tool_name: str,
+    param_items: tuple,
+    strict: bool
+) -> tuple:
+    """Memoized parameter fixing keyed on sorted (name, value) items"""
+    # items (not a dict) in and out so cached results stay immutable
+    return tuple(_fix_parameters(tool_name, dict(param_items), strict).items())
+
+
+def _fix_parameters(
+    tool_name: str,
+    old_parameters: Dict[str, Any],
+    strict: bool
+) -> Dict[str, Any]:
+    """Run the parameter check/fix loop for one call"""
     tool_info = _tool_registry.get_tool(tool_name)
     if not tool_info:
         if strict:
             raise ValueError(f"Tool '{tool_name}' not found")
         return old_parameters
 
-    expected_params = tool_info["metadata"]["parameters"]
-    fixed_parameters = {}
-
-    # Check each expected parameter
-    for param_name, param_info in expected_params.items():
-        if param_name in old_parameters:
-            # Parameter provided, use it
-            value = old_parameters[param_name]
-            # TODO: Add type checking here
-            fixed_parameters[param_name] = value
-        elif param_info["required"]:
-            if strict:
-                raise ValueError(f"Required parameter '{param_name}' missing for tool '{tool_name}'")
-            # Use a placeholder for required parameters
-            fixed_parameters[param_name] = f"<required_{param_name}>"
-        elif param_info["default"] is not None:
-            # Use default value
-            fixed_parameters[param_name] = param_info["default"]
+    metadata = tool_info["metadata"]
+    expected_params = metadata["parameters"]
+
+    missing = metadata["required_params"].difference(old_parameters)
+    if missing and strict:
+        param_name = next(iter(missing))
+        raise ValueError(f"Required parameter '{param_name}' missing for tool '{tool_name}'")
+
+    # defaults underneath, provided values on top, then placeholders
+    # for whatever required names are still absent; unknown keys are
+    # dropped by the known-key filter
+    # TODO: Add type checking here
+    fixed_parameters = {**metadata["defaults"],
+                        **{k: v for k, v in old_parameters.items()
+                           if k in expected_params}}
+    for param_name in missing:
+        fixed_parameters[param_name] = f"<required_{param_name}>"
 
     return fixed_parameters
 
@@ -157,18 +210,20 @@ def validate_tool_call(
     Returns:
         True if valid, False otherwise
     """
+    # validity depends only on which names are present, so memoize on
+    # the name set
+    return _validate_cached(tool_name, frozenset(parameters))
+
+
+@lru_cache(maxsize=1024)
+def _validate_cached(tool_name: str, param_names: frozenset) -> bool:
+    """Memoized required-parameter check for one tool/name-set pair"""
     tool_info = _tool_registry.get_tool(tool_name)
     if not tool_info:
         return False
 
-    expected_params = tool_info["metadata"]["parameters"]
-
-    # Check required parameters
-    for param_name, param_info in expected_params.items():
-        if param_info["required"] and param_name not in parameters:
-            return False
-
-    return True
+    # single C-level set containment against the precomputed set
+    return tool_info["metadata"]["required_params"].issubset(param_names)
 
 
 def get_tool_signature(tool_name: str) -> Optional[str]:
@@ -185,18 +240,22 @@ def get_tool_signature(tool_name: str) -> Optional[str]:
     if not tool_info:
         return None
 
-    metadata = tool_info["metadata"]
-    params = []
+    # formatted once at registration; per-call cost is one dict read
+    return tool_info["metadata"].get("signature_str")
+
 
-    for param_name, param_info in metadata["parameters"].items():
-        param_str = param_name
-        if param_info["type"] != Any:
-            param_str += f": {param_info['type'].__name__}"
-        if not param_info["required"]:
-            param_str += f" = {param_info['default']}"
-        params.append(param_str)
+def _format_signature(tool_name: str, parameters: Dict[str, Any]) -> str:
+    """Render the human-readable signature for one tool"""
+    def param_strs():
+        for param_name, param_info in parameters.items():
+            param_str = param_name
+            if param_info["type"] != Any:
+                param_str += f": {param_info['type'].__name__}"
+            if not param_info["required"]:
+                param_str += f" = {param_info['default']}"
+            yield param_str
 
-    return f"{tool_name}({', '.join(params)})"
+    return f"{tool_name}({', '.join(param_strs())})"
 
 
 def list_available_tools(category: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -6,6 +6,36 @@ Use with extreme caution and only in appropriate controlled environments.
 """
 
 from typing import Any, Optional
+import re
+
+# Refusal/filter markers compiled once into a single alternation; one
+# C-level scan replaces per-keyword substring loops and the .lower()
+# copy of the whole content
+_NSFW_KEYWORDS = ("sorry", "对不起", "can not", "cannot", "unable",
+                  "inappropriate")
+_NSFW_RE = re.compile(
+    r"sorry|对不起|can\s*not|cannot|unable|inappropriate", re.IGNORECASE
+)
+
+try:
+    # Aho-Corasick automaton (~O(N) regardless of keyword count);
+    # optional, the regex alternation above is the fallback
+    import ahocorasick
+
+    _NSFW_AC = ahocorasick.Automaton()
+    for _kw in _NSFW_KEYWORDS:
+        _NSFW_AC.add_word(_kw, _kw)
+    _NSFW_AC.make_automaton()
+
+    def _scan_nsfw_markers(content: str) -> bool:
+        """True if any refusal/filter marker occurs in content"""
+        for _ in _NSFW_AC.iter(content.lower()):
+            return True
+        return False
+except ImportError:
+    def _scan_nsfw_markers(content: str) -> bool:
+        """True if any refusal/filter marker occurs in content"""
+        return _NSFW_RE.search(content) is not None
 
 
 def answer_nsfw(
@@ -46,14 +76,8 @@ def check_nsfw(content: str, threshold: float = 0.7) -> bool:
     """
     # This is a placeholder function for NSFW detection
     # In actual implementation, this would use content classification
-    nsfw_keywords = ["sorry", "对不起", "can not", "cannot", "unable", "inappropriate"]
-    content_lower = content.lower()
-
-    for keyword in nsfw_keywords:
-        if keyword in content_lower:
-            return False  # Content is filtered/safe
-
-    return True  # Content passed NSFW check
+    # no marker found means the content passed the NSFW check
+    return not _scan_nsfw_markers(content)
 
 
 def allow_nsfw(enabled: bool = True) -> None: